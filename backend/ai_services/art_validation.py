@@ -5,25 +5,45 @@ Provides comprehensive validation metrics and quality assessment
 specifically designed for art, culture, and creative puzzles.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, Any, Iterable, List, Tuple, Optional
+from collections import Counter
+from dataclasses import dataclass, astuple
+from functools import lru_cache
+from itertools import chain
+from enum import IntEnum
+from operator import itemgetter
 import re
 import logging
 from .difficulty_framework import ArtDifficultyFactors, KnowledgeDomain, CulturalScope
 
 logger = logging.getLogger(__name__)
 
+# Factual indicator patterns, compiled once at import. Only the presence of a
+# proper noun matters, so a single capitalised word is enough to match
+# without backtracking over multi-word names.
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_DATE_RE = re.compile(r'\b\d{4}\b|\b\d{1,2}th\s+century\b')
 
-class ValidationSeverity(Enum):
+
+class ValidationSeverity(IntEnum):
     """Validation issue severity levels"""
-    INFO = "info"
-    WARNING = "warning" 
-    ERROR = "error"
-    CRITICAL = "critical"
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    CRITICAL = 3
+
+
+# Score penalty and report icon per severity, indexed by ValidationSeverity
+_SEVERITY_PENALTIES = (0.05, 0.15, 0.3, 0.5)
+_SEVERITY_ICONS = ("ℹ️", "⚠️", "❌", "🚨")
+
+# Minimum overall score for a valid puzzle, and metric scores reported as good / fair
+_VALID_SCORE_THRESHOLD = 0.7
+_METRIC_GOOD_THRESHOLD = 0.7
+_METRIC_FAIR_THRESHOLD = 0.5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """Individual validation issue"""
     severity: ValidationSeverity
@@ -32,7 +52,7 @@ class ValidationIssue:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtPuzzleValidation:
     """Comprehensive art puzzle validation results"""
     is_valid: bool
@@ -43,29 +63,134 @@ class ArtPuzzleValidation:
     cultural_accessibility: Dict[str, float]
     
 
+@dataclass(frozen=True, slots=True)
+class _PuzzleText:
+    """Puzzle text fields, read, lower-cased and joined once per validation"""
+    question: str
+    solution: str
+    explanation: str
+    question_lc: str
+    explanation_lc: str
+    full_lc: str  # question + explanation
+    all_lc: str  # question + solution + explanation
+    
+    @classmethod
+    def from_puzzle(cls, puzzle_data: Dict[str, Any]) -> '_PuzzleText':
+        question = puzzle_data.get('question', '')
+        solution = puzzle_data.get('solution', '')
+        explanation = puzzle_data.get('explanation', '')
+        question_lc = question.lower()
+        explanation_lc = explanation.lower()
+        return cls(
+            question=question,
+            solution=solution,
+            explanation=explanation,
+            question_lc=question_lc,
+            explanation_lc=explanation_lc,
+            full_lc=f"{question_lc} {explanation_lc}",
+            all_lc=f"{question_lc} {solution.lower()} {explanation_lc}"
+        )
+
+
+def _score_kernel(metric_values: List[float], severity_counts: List[int]) -> float:
+    """Score a puzzle from its quality metric values and per-severity issue counts"""
+    
+    # Start with base score from quality metrics
+    base_score = sum(metric_values) / max(1, len(metric_values))
+    
+    total_penalty = sum(penalty * count for penalty, count in zip(_SEVERITY_PENALTIES, severity_counts))
+    final_score = max(0.0, base_score - total_penalty)
+    
+    return round(final_score, 3)
+
+
+def _build_keyword_index(keyword_groups: Dict[str, Iterable[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Map each distinct lower-cased keyword to the groups it belongs to"""
+    index = {}
+    for group, keywords in keyword_groups.items():
+        for keyword in keywords:
+            keyword = keyword.lower()
+            index[keyword] = index.get(keyword, ()) + (group,)
+    return index
+
+
 class ArtPuzzleValidator:
     """Comprehensive validator for art puzzles"""
     
-    def __init__(self):
-        self.art_keywords = {
-            'visual_arts': ['painting', 'sculpture', 'artist', 'canvas', 'brush', 'palette', 'style', 'technique'],
-            'music': ['composer', 'symphony', 'opera', 'instrument', 'melody', 'harmony', 'tempo', 'genre'],
-            'film': ['director', 'cinematography', 'screenplay', 'actor', 'genre', 'montage', 'scene'],
-            'architecture': ['architect', 'building', 'style', 'structure', 'design', 'column', 'arch', 'blueprint'],
-            'cultural': ['movement', 'period', 'influence', 'tradition', 'context', 'significance', 'impact']
-        }
+    art_keywords = {
+        'visual_arts': ('painting', 'sculpture', 'artist', 'canvas', 'brush', 'palette', 'style', 'technique'),
+        'music': ('composer', 'symphony', 'opera', 'instrument', 'melody', 'harmony', 'tempo', 'genre'),
+        'film': ('director', 'cinematography', 'screenplay', 'actor', 'genre', 'montage', 'scene'),
+        'architecture': ('architect', 'building', 'style', 'structure', 'design', 'column', 'arch', 'blueprint'),
+        'cultural': ('movement', 'period', 'influence', 'tradition', 'context', 'significance', 'impact')
+    }
+    
+    # Known problematic terms that might be culturally specific or inappropriate
+    cultural_flags = (
+        'slang', 'colloquial', 'regional dialect', 'local custom', 'insider knowledge'
+    )
+    
+    # Quality indicators for art questions
+    quality_indicators = {
+        'descriptive_words': ('style', 'technique', 'period', 'movement', 'characteristics', 'known for'),
+        'context_clues': ('famous for', 'characterized by', 'associated with', 'known to', 'typically'),
+        'specificity_markers': ('specific', 'particular', 'exact', 'precise', 'exactly')
+    }
+    quality_clues = frozenset(
+        clue for clue_set in quality_indicators.values() for clue in clue_set
+    )
+    
+    # Accessibility, language and verifiability indicators
+    regional_indicators = ('american', 'european', 'asian', 'local', 'regional', 'native')
+    complex_words = ('subsequently', 'consequently', 'furthermore', 'nevertheless', 'contemporaneous')
+    subjective_words = ('probably', 'might be', 'could be', 'seems like', 'appears to')
+    specific_terms = ('technique', 'style', 'movement', 'period', 'school', 'method')
+    verification_terms = ('encyclopedia', 'documented', 'recorded', 'established', 'recognized')
+    
+    # Fame markers expected in universal-domain questions and avoided in expert ones
+    recognition_terms = ('famous', 'well-known', 'renowned', 'celebrated')
+    popularity_terms = ('famous', 'popular', 'well-known')
+    
+    # Fame-marker rule per knowledge domain, resolved with one lookup per puzzle:
+    # (terms, raise the issue when the terms are present rather than absent, issue)
+    domain_fame_rules = {
+        KnowledgeDomain.UNIVERSAL: (recognition_terms, False, ValidationIssue(
+            ValidationSeverity.INFO,
+            "universal_domain",
+            "Universal difficulty should reference well-known subjects",
+            "Consider adding context about fame/recognition"
+        )),
+        KnowledgeDomain.EXPERT: (popularity_terms, True, ValidationIssue(
+            ValidationSeverity.WARNING,
+            "expert_domain",
+            "Expert difficulty shouldn't rely on popular knowledge",
+            "Focus on specialized techniques, theories, or lesser-known aspects"
+        ))
+    }
+    
+    # The keyword groups checked against the question and explanation are indexed
+    # once, so that text is searched for each distinct keyword a single time per
+    # puzzle, however many groups share it
+    keyword_groups = {
+        **art_keywords,
+        'quality_clues': quality_clues,
+        'cultural_flags': cultural_flags,
+        'regional_indicators': regional_indicators,
+        'complex_words': complex_words
+    }
+    _keyword_index = _build_keyword_index(keyword_groups)
+    _keyword_chars = frozenset(''.join(_keyword_index))
+    
+    def _scan(self, text: str) -> Counter:
+        """Count keyword hits per group in a single pass over the keyword index"""
         
-        # Known problematic terms that might be culturally specific or inappropriate
-        self.cultural_flags = [
-            'slang', 'colloquial', 'regional dialect', 'local custom', 'insider knowledge'
-        ]
+        # Text sharing no character with any keyword (e.g. an empty explanation) cannot match
+        if self._keyword_chars.isdisjoint(text):
+            return Counter()
         
-        # Quality indicators for art questions
-        self.quality_indicators = {
-            'descriptive_words': ['style', 'technique', 'period', 'movement', 'characteristics', 'known for'],
-            'context_clues': ['famous for', 'characterized by', 'associated with', 'known to', 'typically'],
-            'specificity_markers': ['specific', 'particular', 'exact', 'precise', 'exactly']
-        }
+        # Filter, group lookup and counting all run in C builtins, without a Python-level loop
+        index = self._keyword_index
+        return Counter(chain.from_iterable(map(index.__getitem__, filter(text.__contains__, index))))
     
     def validate_art_puzzle(
         self, 
@@ -75,37 +200,45 @@ class ArtPuzzleValidator:
     ) -> ArtPuzzleValidation:
         """Comprehensive validation of an art puzzle"""
         
+        text = _PuzzleText.from_puzzle(puzzle_data)
+        
+        # Puzzles without a question or solution can never pass, so skip the text analysis
+        if not text.question or not text.solution.strip():
+            return self._reject_incomplete_puzzle(text, difficulty_factors, target_difficulty)
+        
         issues = []
         quality_metrics = {}
+        hits = self._scan(text.full_lc)
         
         # Basic content validation
-        content_issues, content_metrics = self._validate_content_quality(puzzle_data)
+        content_issues, content_metrics = self._validate_content_quality(text)
         issues.extend(content_issues)
         quality_metrics.update(content_metrics)
         
         # Difficulty alignment validation
         difficulty_issues, difficulty_assessment = self._validate_difficulty_alignment(
-            puzzle_data, difficulty_factors, target_difficulty
+            text, difficulty_factors, target_difficulty
         )
         issues.extend(difficulty_issues)
         
         # Cultural accessibility validation
-        cultural_issues, cultural_metrics = self._validate_cultural_accessibility(puzzle_data)
+        cultural_issues, cultural_metrics = self._validate_cultural_accessibility(hits)
         issues.extend(cultural_issues)
         
         # Art domain validation
-        domain_issues, domain_metrics = self._validate_art_domain(puzzle_data)
+        domain_issues, domain_metrics = self._validate_art_domain(hits)
         issues.extend(domain_issues)
         quality_metrics.update(domain_metrics)
         
         # Factual accuracy indicators
-        accuracy_issues, accuracy_metrics = self._validate_factual_indicators(puzzle_data)
+        accuracy_issues, accuracy_metrics = self._validate_factual_indicators(text)
         issues.extend(accuracy_issues)
         quality_metrics.update(accuracy_metrics)
         
         # Calculate overall validation score
-        overall_score = self._calculate_overall_score(issues, quality_metrics)
-        is_valid = overall_score >= 0.7 and not any(issue.severity == ValidationSeverity.CRITICAL for issue in issues)
+        severity_counts = self._count_severities(issues)
+        overall_score = self._calculate_overall_score(severity_counts, quality_metrics)
+        is_valid = overall_score >= _VALID_SCORE_THRESHOLD and severity_counts[ValidationSeverity.CRITICAL] == 0
         
         return ArtPuzzleValidation(
             is_valid=is_valid,
@@ -116,14 +249,85 @@ class ArtPuzzleValidator:
             cultural_accessibility=cultural_metrics
         )
     
-    def _validate_content_quality(self, puzzle_data: Dict[str, Any]) -> Tuple[List[ValidationIssue], Dict[str, float]]:
+    def validate_art_puzzle_cached(
+        self, 
+        puzzle_data: Dict[str, Any], 
+        difficulty_factors: ArtDifficultyFactors,
+        target_difficulty: float
+    ) -> ArtPuzzleValidation:
+        """
+        Validate an art puzzle, reusing the result when the same puzzle is re-validated
+        against the same difficulty (e.g. during regeneration retries).
+        
+        The returned validation is shared between callers and must not be mutated.
+        """
+        return _validate_from_key(
+            puzzle_data.get('question', ''),
+            puzzle_data.get('solution', ''),
+            puzzle_data.get('explanation', ''),
+            astuple(difficulty_factors),
+            target_difficulty
+        )
+    
+    def _reject_incomplete_puzzle(
+        self, 
+        text: _PuzzleText, 
+        difficulty_factors: ArtDifficultyFactors,
+        target_difficulty: float
+    ) -> ArtPuzzleValidation:
+        """Fail a puzzle that is missing its question or solution without scoring it"""
+        issues = []
+        
+        if not text.question:
+            issues.append(ValidationIssue(
+                ValidationSeverity.CRITICAL,
+                "question_missing",
+                "Question cannot be empty"
+            ))
+        
+        if not text.solution.strip():
+            issues.append(ValidationIssue(
+                ValidationSeverity.CRITICAL,
+                "solution_missing",
+                "Solution cannot be empty"
+            ))
+        
+        return ArtPuzzleValidation(
+            is_valid=False,
+            overall_score=0.0,
+            issues=issues,
+            quality_metrics={},
+            difficulty_assessment=self._build_difficulty_assessment(difficulty_factors, target_difficulty),
+            cultural_accessibility={}
+        )
+    
+    def _build_difficulty_assessment(
+        self, 
+        difficulty_factors: ArtDifficultyFactors,
+        target_difficulty: float
+    ) -> Dict[str, Any]:
+        """Summarise target vs. calculated difficulty and the factors behind it"""
+        return {
+            'target_difficulty': target_difficulty,
+            'calculated_difficulty': difficulty_factors.calculate_composite_difficulty(),
+            'factors': {
+                'knowledge_domain': difficulty_factors.knowledge_domain.value,
+                'cultural_scope': difficulty_factors.cultural_scope.value,
+                'cognitive_load': difficulty_factors.cognitive_load.value
+            }
+        }
+    
+    def _validate_content_quality(
+        self, 
+        text: _PuzzleText
+    ) -> Tuple[List[ValidationIssue], Dict[str, float]]:
         """Validate basic content quality"""
         issues = []
         metrics = {}
         
-        question = puzzle_data.get('question', '')
-        solution = puzzle_data.get('solution', '')
-        explanation = puzzle_data.get('explanation', '')
+        question = text.question
+        solution = text.solution
+        explanation = text.explanation
         
         # Question quality checks
         if len(question) < 20:
@@ -176,24 +380,16 @@ class ArtPuzzleValidator:
     
     def _validate_difficulty_alignment(
         self, 
-        puzzle_data: Dict[str, Any], 
+        text: _PuzzleText,
         difficulty_factors: ArtDifficultyFactors,
         target_difficulty: float
     ) -> Tuple[List[ValidationIssue], Dict[str, Any]]:
         """Validate that puzzle aligns with intended difficulty"""
         issues = []
-        assessment = {
-            'target_difficulty': target_difficulty,
-            'calculated_difficulty': difficulty_factors.calculate_composite_difficulty(),
-            'factors': {
-                'knowledge_domain': difficulty_factors.knowledge_domain.value,
-                'cultural_scope': difficulty_factors.cultural_scope.value,
-                'cognitive_load': difficulty_factors.cognitive_load.value
-            }
-        }
+        assessment = self._build_difficulty_assessment(difficulty_factors, target_difficulty)
+        calculated_difficulty = assessment['calculated_difficulty']
         
-        question = puzzle_data.get('question', '').lower()
-        calculated_difficulty = difficulty_factors.calculate_composite_difficulty()
+        question = text.question_lc
         
         # Check difficulty calibration
         difficulty_delta = abs(calculated_difficulty - target_difficulty)
@@ -206,37 +402,24 @@ class ArtPuzzleValidator:
             ))
         
         # Domain-specific difficulty indicators
-        if difficulty_factors.knowledge_domain == KnowledgeDomain.UNIVERSAL:
-            if not any(famous in question for famous in ['famous', 'well-known', 'renowned', 'celebrated']):
-                issues.append(ValidationIssue(
-                    ValidationSeverity.INFO,
-                    "universal_domain",
-                    "Universal difficulty should reference well-known subjects",
-                    "Consider adding context about fame/recognition"
-                ))
-        
-        elif difficulty_factors.knowledge_domain == KnowledgeDomain.EXPERT:
-            if any(basic in question for basic in ['famous', 'popular', 'well-known']):
-                issues.append(ValidationIssue(
-                    ValidationSeverity.WARNING,
-                    "expert_domain",
-                    "Expert difficulty shouldn't rely on popular knowledge",
-                    "Focus on specialized techniques, theories, or lesser-known aspects"
-                ))
+        rule = self.domain_fame_rules.get(difficulty_factors.knowledge_domain)
+        if rule:
+            terms, flag_when_present, issue = rule
+            if any(term in question for term in terms) == flag_when_present:
+                issues.append(issue)
         
         return issues, assessment
     
-    def _validate_cultural_accessibility(self, puzzle_data: Dict[str, Any]) -> Tuple[List[ValidationIssue], Dict[str, float]]:
+    def _validate_cultural_accessibility(
+        self, 
+        hits: Counter
+    ) -> Tuple[List[ValidationIssue], Dict[str, float]]:
         """Validate cultural accessibility and inclusivity"""
         issues = []
         metrics = {}
         
-        question = puzzle_data.get('question', '').lower()
-        explanation = puzzle_data.get('explanation', '').lower()
-        full_text = f"{question} {explanation}".lower()
-        
         # Check for cultural flags
-        cultural_flag_count = sum(1 for flag in self.cultural_flags if flag in full_text)
+        cultural_flag_count = hits['cultural_flags']
         if cultural_flag_count > 0:
             issues.append(ValidationIssue(
                 ValidationSeverity.WARNING,
@@ -246,34 +429,28 @@ class ArtPuzzleValidator:
             ))
         
         # Check for region-specific references
-        regional_indicators = ['american', 'european', 'asian', 'local', 'regional', 'native']
-        regional_count = sum(1 for indicator in regional_indicators if indicator in full_text)
+        regional_count = hits['regional_indicators']
         
         # Assess accessibility score
         accessibility_score = 1.0 - (cultural_flag_count * 0.2) - (regional_count * 0.1)
         metrics['cultural_accessibility'] = max(0.0, accessibility_score)
         
         # Language complexity check
-        complex_words = ['subsequently', 'consequently', 'furthermore', 'nevertheless', 'contemporaneous']
-        complexity_count = sum(1 for word in complex_words if word in full_text)
+        complexity_count = hits['complex_words']
         metrics['language_accessibility'] = max(0.0, 1.0 - complexity_count * 0.15)
         
         return issues, metrics
     
-    def _validate_art_domain(self, puzzle_data: Dict[str, Any]) -> Tuple[List[ValidationIssue], Dict[str, float]]:
+    def _validate_art_domain(
+        self, 
+        hits: Counter
+    ) -> Tuple[List[ValidationIssue], Dict[str, float]]:
         """Validate that puzzle is appropriately art-focused"""
         issues = []
         metrics = {}
         
-        question = puzzle_data.get('question', '').lower()
-        explanation = puzzle_data.get('explanation', '').lower()
-        full_text = f"{question} {explanation}".lower()
-        
         # Check for art domain keywords
-        domain_scores = {}
-        for domain, keywords in self.art_keywords.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in full_text)
-            domain_scores[domain] = keyword_count
+        domain_scores = {domain: hits[domain] for domain in self.art_keywords}
         
         total_art_keywords = sum(domain_scores.values())
         if total_art_keywords == 0:
@@ -285,30 +462,27 @@ class ArtPuzzleValidator:
             ))
         
         # Identify primary domain
-        primary_domain = max(domain_scores, key=domain_scores.get) if domain_scores else None
+        primary_domain = max(domain_scores.items(), key=itemgetter(1))[0] if domain_scores else None
         metrics['art_domain_strength'] = min(1.0, total_art_keywords / 3)
         metrics['domain_focus'] = domain_scores.get(primary_domain, 0) / max(1, total_art_keywords)
         
         # Check for context clues
-        context_clue_count = sum(1 for clue_set in self.quality_indicators.values() 
-                                for clue in clue_set if clue in full_text)
+        context_clue_count = hits['quality_clues']
         metrics['context_richness'] = min(1.0, context_clue_count / 3)
         
         return issues, metrics
     
-    def _validate_factual_indicators(self, puzzle_data: Dict[str, Any]) -> Tuple[List[ValidationIssue], Dict[str, float]]:
+    def _validate_factual_indicators(
+        self, 
+        text: _PuzzleText
+    ) -> Tuple[List[ValidationIssue], Dict[str, float]]:
         """Validate indicators of factual accuracy and verifiability"""
         issues = []
         metrics = {}
         
-        question = puzzle_data.get('question', '')
-        solution = puzzle_data.get('solution', '')
-        explanation = puzzle_data.get('explanation', '')
-        
         # Check for vague or subjective language
-        subjective_words = ['probably', 'might be', 'could be', 'seems like', 'appears to']
-        subjective_count = sum(1 for word in subjective_words 
-                             if word in f"{question} {solution} {explanation}".lower())
+        all_text = text.all_lc
+        subjective_count = sum(1 for word in self.subjective_words if word in all_text)
         
         if subjective_count > 0:
             issues.append(ValidationIssue(
@@ -319,45 +493,35 @@ class ArtPuzzleValidator:
             ))
         
         # Check for specific dates, names, or concrete facts
-        has_proper_nouns = bool(re.search(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', solution))
-        has_dates = bool(re.search(r'\b\d{4}\b|\b\d{1,2}th\s+century\b', f"{question} {explanation}"))
-        has_specific_terms = any(term in explanation.lower() for term in 
-                               ['technique', 'style', 'movement', 'period', 'school', 'method'])
+        has_proper_nouns = bool(_PROPER_NOUN_RE.search(text.solution))
+        has_dates = bool(_DATE_RE.search(f"{text.question} {text.explanation}"))
+        explanation = text.explanation_lc
+        has_specific_terms = any(term in explanation for term in self.specific_terms)
         
         factual_indicators = sum([has_proper_nouns, has_dates, has_specific_terms])
         metrics['factual_specificity'] = factual_indicators / 3
         
         # Verifiability indicators
-        verification_terms = ['encyclopedia', 'documented', 'recorded', 'established', 'recognized']
-        verification_score = sum(1 for term in verification_terms 
-                               if term in explanation.lower()) / len(verification_terms)
+        verification_score = sum(1 for term in self.verification_terms if term in explanation) / len(self.verification_terms)
         metrics['verifiability_indicators'] = verification_score
         
         return issues, metrics
     
-    def _calculate_overall_score(self, issues: List[ValidationIssue], quality_metrics: Dict[str, float]) -> float:
+    def _count_severities(self, issues: List[ValidationIssue]) -> List[int]:
+        """Count issues per severity, indexed by ValidationSeverity"""
+        severity_counts = [0] * len(ValidationSeverity)
+        for issue in issues:
+            severity_counts[issue.severity] += 1
+        return severity_counts
+    
+    def _calculate_overall_score(self, severity_counts: List[int], quality_metrics: Dict[str, float]) -> float:
         """Calculate overall validation score"""
-        
-        # Start with base score from quality metrics
-        base_score = sum(quality_metrics.values()) / max(1, len(quality_metrics))
-        
-        # Apply penalties for issues
-        penalties = {
-            ValidationSeverity.INFO: 0.05,
-            ValidationSeverity.WARNING: 0.15,
-            ValidationSeverity.ERROR: 0.3,
-            ValidationSeverity.CRITICAL: 0.5
-        }
-        
-        total_penalty = sum(penalties.get(issue.severity, 0) for issue in issues)
-        final_score = max(0.0, base_score - total_penalty)
-        
-        return round(final_score, 3)
+        return _score_kernel(list(quality_metrics.values()), severity_counts)
     
     def generate_validation_report(self, validation: ArtPuzzleValidation) -> str:
         """Generate human-readable validation report"""
         
-        report = f"""
+        parts = [f"""
 Art Puzzle Validation Report
 ===========================
 
@@ -366,23 +530,22 @@ Status: {'✅ VALID' if validation.is_valid else '❌ NEEDS IMPROVEMENT'}
 
 Quality Metrics:
 {'-' * 40}
-"""
+"""]
         
         for metric, score in validation.quality_metrics.items():
-            status = "✅" if score >= 0.7 else "⚠️" if score >= 0.5 else "❌"
-            report += f"{status} {metric.replace('_', ' ').title()}: {score:.2f}\n"
+            status = "✅" if score >= _METRIC_GOOD_THRESHOLD else "⚠️" if score >= _METRIC_FAIR_THRESHOLD else "❌"
+            parts.append(f"{status} {metric.replace('_', ' ').title()}: {score:.2f}\n")
         
         if validation.issues:
-            report += f"\nIssues Found ({len(validation.issues)}):\n{'-' * 40}\n"
+            parts.append(f"\nIssues Found ({len(validation.issues)}):\n{'-' * 40}\n")
             for issue in validation.issues:
-                severity_icon = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "critical": "🚨"}
-                icon = severity_icon.get(issue.severity.value, "❓")
-                report += f"{icon} {issue.severity.value.upper()}: {issue.message}\n"
+                icon = _SEVERITY_ICONS[issue.severity]
+                parts.append(f"{icon} {issue.severity.name}: {issue.message}\n")
                 if issue.suggestion:
-                    report += f"   💡 Suggestion: {issue.suggestion}\n"
-                report += "\n"
+                    parts.append(f"   💡 Suggestion: {issue.suggestion}\n")
+                parts.append("\n")
         
-        report += f"""
+        parts.append(f"""
 Difficulty Assessment:
 {'-' * 40}
 Target: {validation.difficulty_assessment['target_difficulty']:.2f}
@@ -394,6 +557,33 @@ Cultural Accessibility:
 {'-' * 40}
 Accessibility Score: {validation.cultural_accessibility.get('cultural_accessibility', 0):.2f}
 Language Score: {validation.cultural_accessibility.get('language_accessibility', 0):.2f}
-"""
+""")
         
-        return report
\ No newline at end of file
+        return "".join(parts)
+
+
+_validator: Optional[ArtPuzzleValidator] = None
+
+
+def _get_validator() -> ArtPuzzleValidator:
+    """Return the validator shared by the puzzle services"""
+    
+    # A race may build a spare instance; construction is idempotent, so no lock is needed
+    global _validator
+    if _validator is None:
+        _validator = ArtPuzzleValidator()
+    return _validator
+
+
+# Validators keep no per-instance state, so one module-level memo serves every instance
+@lru_cache(maxsize=2048)
+def _validate_from_key(
+    question: str, 
+    solution: str, 
+    explanation: str,
+    factors_key: Tuple[Any, ...],
+    target_difficulty: float
+) -> ArtPuzzleValidation:
+    """Run an uncached validation from a validate_art_puzzle_cached key"""
+    puzzle_data = {'question': question, 'solution': solution, 'explanation': explanation}
+    return _get_validator().validate_art_puzzle(puzzle_data, ArtDifficultyFactors(*factors_key), target_difficulty)
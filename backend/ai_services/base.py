@@ -4,6 +4,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+CATEGORY_CONTEXTS = {
+    'math': "Focus on algebra, geometry, number theory, or applied mathematics. Ensure solutions are precise and verifiable.",
+    'word': "Create wordplay, riddles, anagrams, or language puzzles. Solutions should be clever but unambiguous.",
+    'art': "Create puzzles about visual arts, music, film, architecture, or cultural knowledge. Examples: artist identification, art movement recognition, color theory, famous works, film/music trivia, architectural styles. Ensure answers are factual and verifiable."
+}
+
 
 class PuzzleGenerationError(Exception):
     """Custom exception for puzzle generation failures"""
@@ -77,9 +83,4 @@ class BasePuzzleGenerator(ABC):
     
     def get_category_context(self, category: str) -> str:
         """Get context-specific information for each category"""
-        contexts = {
-            'math': "Focus on algebra, geometry, number theory, or applied mathematics. Ensure solutions are precise and verifiable.",
-            'word': "Create wordplay, riddles, anagrams, or language puzzles. Solutions should be clever but unambiguous.", 
-            'art': "Create puzzles about visual arts, music, film, architecture, or cultural knowledge. Examples: artist identification, art movement recognition, color theory, famous works, film/music trivia, architectural styles. Ensure answers are factual and verifiable."
-        }
-        return contexts.get(category, "General puzzle")
\ No newline at end of file
+        return CATEGORY_CONTEXTS.get(category, "General puzzle")
\ No newline at end of file
@@ -1,8 +1,19 @@
+import ast
 import asyncio
+import atexit
+import hashlib
 import json
+import weakref
+from bisect import bisect_left
+from dataclasses import astuple
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
 import httpx
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, Coroutine, List, Optional, Tuple
 from django.conf import settings
+from django.core.cache import cache
 from .base import BasePuzzleGenerator, PuzzleGenerationError
 from .difficulty_framework import (
     ArtDifficultyCalibrator, 
@@ -10,21 +21,214 @@ from .difficulty_framework import (
     ArtDifficultyFactors
 )
 from .visual_art_puzzles import generate_visual_art_puzzle
+from .rate_limiting import AsyncRateLimiter
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Translation table for the cleaning fallback: every ASCII control character becomes a space
+_CONTROL_CHARS_TO_SPACE = str.maketrans({code: ' ' for code in (*range(0x20), 0x7F)})
+
+_REQUIRED_PUZZLE_FIELDS = frozenset(("question", "solution", "explanation"))
+
+# Defaults for optional fields; "hints" is added per response so no list is shared
+_PUZZLE_DEFAULTS = MappingProxyType({
+    "media_url": None,
+    "estimated_solve_time": 180,
+    "difficulty_justification": "Standard difficulty",
+    # Enhanced art puzzle fields
+    "knowledge_verification": "Standard verification",
+    "cultural_considerations": "Universal accessibility"
+})
+
+_MOCK_PUZZLES = MappingProxyType({
+    'math': {
+        'question': 'If a train travels 60 miles in 45 minutes, what is its speed in miles per hour?',
+        'solution': '80 mph',
+        'explanation': 'Speed = Distance / Time. Convert 45 minutes to 0.75 hours: 60 miles / 0.75 hours = 80 mph'
+    },
+    'word': {
+        'question': 'What 7-letter word becomes longer when the third letter is removed?',
+        'solution': 'lounger',
+        'explanation': 'Remove the "u" from "lounger" to get "longer"'
+    },
+    'art': {
+        'question': 'Which famous painting technique creates the illusion of depth by making distant objects appear bluer and less distinct?',
+        'solution': 'atmospheric perspective',
+        'explanation': 'Atmospheric perspective mimics how the atmosphere affects our perception of distant objects'
+    }
+})
+
+_FALLBACK_ART_PUZZLES = MappingProxyType({
+    0.3: {
+        'question': 'Which primary color is missing from this group: Red, Blue?',
+        'solution': 'Yellow',
+        'explanation': 'The three primary colors are Red, Blue, and Yellow.'
+    },
+    0.6: {
+        'question': 'What art movement is characterized by geometric shapes and multiple perspectives?',
+        'solution': 'Cubism',
+        'explanation': 'Cubism, pioneered by Picasso and Braque, broke subjects into geometric forms.'
+    },
+    0.9: {
+        'question': 'Which technique uses mathematical ratios to create harmonious proportions?',
+        'solution': 'Golden Ratio',
+        'explanation': 'The Golden Ratio (φ ≈ 1.618) has been used since ancient times for aesthetic proportions.'
+    }
+})
+
+_FALLBACK_DIFFICULTIES = tuple(sorted(_FALLBACK_ART_PUZZLES))
+
+_FALLBACK_HINTS = ('Think about art fundamentals', 'Consider visual principles')
+
+_MOCK_HINTS = ('Think step by step', 'Consider the key concepts')
+
+# Retries for 429 responses; backoff doubles from 1s unless the API sends Retry-After
+_MAX_RATE_LIMIT_RETRIES = 3
+
+# Only the start of an error response is kept for the exception message
+_MAX_ERROR_BODY_BYTES = 1024
+
+_GENERIC_PROMPT_TEMPLATE = Template("""
+            You are an expert puzzle creator for "The Daily Puzzle" game. Generate a $category puzzle with $difficulty_desc.
+            
+            Context: $category_context
+            
+            Requirements:
+            - Create an engaging, fair puzzle appropriate for the difficulty level
+            - Ensure there is exactly one correct answer
+            - Make the puzzle solvable within 5 minutes for someone with appropriate skill level
+            - Avoid culturally specific references that might confuse international users
+            - For math: Show clear problem setup, avoid trick questions
+            - For word: Ensure wordplay is clever but not obscure
+            
+            Respond in this exact JSON format:
+            {
+                "question": "The puzzle question/prompt",
+                "solution": "The exact correct answer", 
+                "explanation": "Clear explanation of how to solve it",
+                "hints": ["optional hint 1", "optional hint 2"],
+                "media_url": null,
+                "estimated_solve_time": 180,
+                "difficulty_justification": "Why this matches the requested difficulty"
+            }
+            
+            Generate a high-quality puzzle now:
+            """)
+
+_VALIDATION_PROMPT_TEMPLATE = Template("""
+        You are validating a $category puzzle. Attempt to solve it independently and check if your solution matches the expected answer.
+        
+        Puzzle Question: $question
+        Expected Solution: $solution
+        
+        Respond in this JSON format:
+        {
+            "is_valid": true/false,
+            "generated_solution": "your solution attempt",
+            "confidence": 0.0-1.0,
+            "issues": ["any problems found"],
+            "reasoning": "your step-by-step solution process"
+        }
+        """)
+
+# Mini-difficulty puzzles need no elaborate scaffold; the parser fills in the optional fields
+_MINIMAL_PROMPT_TEMPLATE = Template("""You are an expert puzzle creator for "The Daily Puzzle" game. Generate a $category puzzle with $difficulty_desc.
+Context: $category_context
+The puzzle must be fair, have exactly one correct answer, and avoid culturally specific references.
+Respond in this exact JSON format:
+{"question": "The puzzle question", "solution": "The exact correct answer", "explanation": "How to solve it", "hints": ["optional hint"]}""")
+
+
+def _decode_json_object(text: str) -> Dict[str, Any]:
+    """Decode the first JSON object in a Claude reply, ignoring prose or code fences around it"""
+    
+    # Claude sometimes adds extra text; one find locates the object and raw_decode
+    # stops at its closing brace, so trailing text needs no rfind or slice
+    start_idx = text.find('{')
+    if start_idx == -1:
+        raise ValueError("No JSON found in response")
+    
+    return _JSON_DECODER.raw_decode(text, start_idx)[0]
+
+
+class _JsonObjectBoundary:
+    """Tracks streamed reply text until the first top-level JSON object closes"""
+    
+    def __init__(self):
+        self.started = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk of text; True once the first object is complete"""
+        
+        if not self.started:
+            start_idx = text.find('{')
+            if start_idx == -1:
+                return False
+            text = text[start_idx:]
+            self.started = True
+        
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
 
 
 class Claude4PuzzleGenerator(BasePuzzleGenerator):
     """Claude-4 puzzle generator implementation"""
     
+    # One pooled client per event loop; connections cannot outlive the loop they were opened on
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    # Shared by every generator so the whole process stays under the API's request rate
+    _rate_limiter: Optional[AsyncRateLimiter] = None
+    
     def __init__(self):
         super().__init__("claude4")
         self.api_key = settings.ANTHROPIC_API_KEY
         self.base_url = "https://api.anthropic.com/v1/messages"
         self.model = "claude-3-5-sonnet-20241022"  # Using latest available Claude model
+        self.fast_model = settings.CLAUDE_FAST_MODEL  # Used for Mini-difficulty generation
+        
+        # Request parts that never change between calls; only the prompt varies
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
+        self._payload_skeleton = {
+            "model": self.model,
+            "max_tokens": 1000
+        }
         
         # Initialize sophisticated difficulty and prompt systems
         self.difficulty_calibrator = ArtDifficultyCalibrator()
         self.prompt_builder = DynamicPromptBuilder()
         
+        # Rendered prompts keyed by category, difficulty tier and constraints
+        self._render_prompt = lru_cache(maxsize=512)(self._render_prompt_uncached)
+        
+        # API calls currently awaiting a reply, keyed by event loop, model and prompt
+        self._inflight_requests: Dict[Tuple[asyncio.AbstractEventLoop, Optional[str], str], asyncio.Future] = {}
+        
+        if Claude4PuzzleGenerator._rate_limiter is None:
+            Claude4PuzzleGenerator._rate_limiter = AsyncRateLimiter(settings.ANTHROPIC_MAX_REQUESTS_PER_SECOND)
+        
         # Security: Never log the actual API key
         self.mock_mode = not self.api_key or not self.api_key.startswith('sk-ant-')
         if self.mock_mode:
@@ -34,7 +238,7 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
                 self.logger.warning("Invalid ANTHROPIC_API_KEY format - running in mock mode")
         else:
             # Only log that key is configured, never the actual key
-            self.logger.info(f"Claude-4 initialized with API key (ends with ...{self.api_key[-8:]})")
+            self.logger.info("Claude-4 initialized with API key (ends with ...%s)", self.api_key[-8:])
     
     async def generate_puzzle(
         self, 
@@ -53,19 +257,85 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
         if self.mock_mode:
             return self._generate_mock_puzzle(category, difficulty)
         
+        cache_timeout = settings.PUZZLE_GENERATION_CACHE_TIMEOUT
+        cache_key = self._generation_cache_key(category, difficulty, constraints) if cache_timeout else None
+        if cache_key is not None:
+            cached_puzzle = await cache.aget(cache_key)
+            if cached_puzzle is not None:
+                self.logger.info("Reused cached %s puzzle at difficulty %s", category, difficulty)
+                return cached_puzzle
+        
         prompt = self._build_generation_prompt(category, difficulty, constraints)
+        model = self._select_model(difficulty)
         
         try:
-            response = await self._call_claude_api(prompt)
+            # Identical requests may share a puzzle only when the caller opted into reuse via the cache
+            if cache_key is not None:
+                response = await self._call_claude_api_shared(prompt, model)
+            else:
+                response = await self._call_claude_api(prompt, model)
             puzzle_data = self._parse_puzzle_response(response)
             
-            self.logger.info(f"Generated {category} puzzle at difficulty {difficulty}")
+            if cache_key is not None:
+                await cache.aset(cache_key, puzzle_data, cache_timeout)
+            
+            self.logger.info("Generated %s puzzle at difficulty %s", category, difficulty)
             return puzzle_data
             
         except Exception as e:
-            self.logger.error(f"Puzzle generation failed: {str(e)}")
+            self.logger.error("Puzzle generation failed: %s", e)
             raise PuzzleGenerationError(f"Failed to generate puzzle: {str(e)}")
     
+    def _generation_cache_key(
+        self,
+        category: str,
+        difficulty: float,
+        constraints: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build the cache key for a generation request, or None if it cannot be cached"""
+        
+        try:
+            constraints_json = orjson.dumps(constraints, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Constraints orjson can't encode (e.g. a set) have no stable key; generate uncached
+            return None
+        
+        request_key = b"|".join((category.encode(), str(round(difficulty, 2)).encode(), constraints_json))
+        return f"claude4:puzzle:{hashlib.blake2b(request_key, digest_size=16).hexdigest()}"
+    
+    def _validation_cache_key(self, question: str, solution: str, category: str) -> str:
+        """Build the cache key for validating a puzzle"""
+        
+        # The verdict is only valid for the generator and model that produced it. Model answers
+        # are not always strings (e.g. a numeric math solution)
+        request_key = "|".join((
+            type(self).__name__,
+            self._payload_skeleton["model"],
+            category,
+            str(question).strip(),
+            str(solution).strip()
+        )).encode()
+        return f"claude4:validation:{hashlib.blake2b(request_key, digest_size=16).hexdigest()}"
+    
+    async def generate_puzzles_batch(
+        self,
+        requests: List[Tuple[str, float, Optional[Dict[str, Any]]]],
+        concurrency: int = 8
+    ) -> List[Any]:
+        """Generate several puzzles concurrently, at most `concurrency` API calls in flight"""
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _generate_one(request: Tuple[str, float, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_puzzle(*request)
+        
+        # Failed puzzles come back as exception instances so one bad request doesn't sink the batch
+        return await asyncio.gather(
+            *[_generate_one(request) for request in requests],
+            return_exceptions=True
+        )
+    
     async def validate_puzzle(
         self, 
         question: str, 
@@ -77,31 +347,35 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
         if self.mock_mode:
             return self._generate_mock_validation(question, solution, category)
         
-        validation_prompt = f"""
-        You are validating a {category} puzzle. Attempt to solve it independently and check if your solution matches the expected answer.
+        # Re-validating the same puzzle (regeneration retries, cross-model checks) reuses the answer
+        cache_timeout = settings.PUZZLE_VALIDATION_CACHE_TIMEOUT
+        if cache_timeout:
+            cache_key = self._validation_cache_key(question, solution, category)
+            cached_validation = await cache.aget(cache_key)
+            if cached_validation is not None:
+                self.logger.info("Validation cache hit for %s puzzle", category)
+                return cached_validation
+            self.logger.info("Validation cache miss for %s puzzle", category)
         
-        Puzzle Question: {question}
-        Expected Solution: {solution}
-        
-        Respond in this JSON format:
-        {{
-            "is_valid": true/false,
-            "generated_solution": "your solution attempt",
-            "confidence": 0.0-1.0,
-            "issues": ["any problems found"],
-            "reasoning": "your step-by-step solution process"
-        }}
-        """
+        validation_prompt = _VALIDATION_PROMPT_TEMPLATE.substitute(
+            category=category,
+            question=question,
+            solution=solution
+        )
         
         try:
-            response = await self._call_claude_api(validation_prompt)
-            validation_data = json.loads(response)
+            response = await self._call_claude_api_shared(validation_prompt)
+            validation_data = _decode_json_object(response)
+            
+            # Only successful validations are cached; failures below are retried next time
+            if cache_timeout:
+                await cache.aset(cache_key, validation_data, cache_timeout)
             
-            self.logger.info(f"Validated puzzle with confidence {validation_data.get('confidence', 0)}")
+            self.logger.info("Validated puzzle with confidence %s", validation_data.get('confidence', 0))
             return validation_data
             
         except Exception as e:
-            self.logger.error(f"Puzzle validation failed: {str(e)}")
+            self.logger.error("Puzzle validation failed: %s", e)
             return {
                 "is_valid": False,
                 "generated_solution": "",
@@ -120,7 +394,10 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
             # Generate visual art puzzle
             visual_puzzle = await generate_visual_art_puzzle(difficulty_factors)
             
-            self.logger.info(f"Generated visual art puzzle: {visual_puzzle.get('puzzle_type', 'unknown')} at difficulty {difficulty}")
+            self.logger.info(
+                "Generated visual art puzzle: %s at difficulty %s",
+                visual_puzzle.get('puzzle_type', 'unknown'), difficulty
+            )
             
             # Add metadata
             visual_puzzle.update({
@@ -133,40 +410,26 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
             return visual_puzzle
             
         except Exception as e:
-            self.logger.error(f"Visual art puzzle generation failed: {str(e)}")
+            self.logger.error("Visual art puzzle generation failed: %s", e)
             # Fallback to text-based art puzzle if visual generation fails
             return await self._generate_fallback_art_puzzle(difficulty)
     
     async def _generate_fallback_art_puzzle(self, difficulty: float) -> Dict[str, Any]:
         """Generate fallback text-based art puzzle if visual generation fails"""
         
-        fallback_puzzles = {
-            0.3: {
-                'question': 'Which primary color is missing from this group: Red, Blue?',
-                'solution': 'Yellow',
-                'explanation': 'The three primary colors are Red, Blue, and Yellow.'
-            },
-            0.6: {
-                'question': 'What art movement is characterized by geometric shapes and multiple perspectives?',
-                'solution': 'Cubism',
-                'explanation': 'Cubism, pioneered by Picasso and Braque, broke subjects into geometric forms.'
-            },
-            0.9: {
-                'question': 'Which technique uses mathematical ratios to create harmonious proportions?',
-                'solution': 'Golden Ratio',
-                'explanation': 'The Golden Ratio (φ ≈ 1.618) has been used since ancient times for aesthetic proportions.'
-            }
-        }
-        
-        # Find closest difficulty level
-        closest_difficulty = min(fallback_puzzles.keys(), key=lambda x: abs(x - difficulty))
-        puzzle = fallback_puzzles[closest_difficulty]
+        # Find closest difficulty level; only the neighbours of the insertion point can be closest
+        insert_idx = bisect_left(_FALLBACK_DIFFICULTIES, difficulty)
+        closest_difficulty = min(
+            _FALLBACK_DIFFICULTIES[max(0, insert_idx - 1):insert_idx + 1],
+            key=lambda level: abs(level - difficulty)
+        )
+        puzzle = _FALLBACK_ART_PUZZLES[closest_difficulty]
         
         return {
             'question': puzzle['question'],
             'solution': puzzle['solution'],
             'explanation': puzzle['explanation'],
-            'hints': ['Think about art fundamentals', 'Consider visual principles'],
+            'hints': list(_FALLBACK_HINTS),
             'media_url': None,
             'estimated_solve_time': 180,
             'puzzle_format': 'text',
@@ -192,129 +455,210 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
             # Log difficulty analysis for monitoring
             calculated_difficulty = difficulty_factors.calculate_composite_difficulty()
             self.logger.info(
-                f"Art puzzle difficulty: target={difficulty:.3f}, calculated={calculated_difficulty:.3f}, "
-                f"domain={difficulty_factors.knowledge_domain.value}, "
-                f"cognitive_load={difficulty_factors.cognitive_load.value}"
+                "Art puzzle difficulty: target=%.3f, calculated=%.3f, domain=%s, cognitive_load=%s",
+                difficulty, calculated_difficulty,
+                difficulty_factors.knowledge_domain.value,
+                difficulty_factors.cognitive_load.value
             )
             
             # Validate difficulty calibration
             if not self.difficulty_calibrator.validate_difficulty_match(difficulty_factors, difficulty):
                 self.logger.warning(
-                    f"Difficulty mismatch: target={difficulty:.3f}, calculated={calculated_difficulty:.3f}"
+                    "Difficulty mismatch: target=%.3f, calculated=%.3f", difficulty, calculated_difficulty
                 )
             
+            # The prompt depends only on the factors (the framework ignores constraints),
+            # so every target in the same tier reuses it
+            return self._render_prompt(category, astuple(difficulty_factors), b"")
+        
+        # Math/word prompts append the constraints as JSON, which also keys the prompt memo
+        try:
+            constraints_json = orjson.dumps(constraints, option=orjson.OPT_SORT_KEYS) if constraints else b""
+        except TypeError as e:
+            raise PuzzleGenerationError(f"Puzzle constraints are not JSON serialisable: {str(e)}")
+        
+        # Use original system for math/word puzzles (can be enhanced later)
+        return self._render_prompt(
+            category, (difficulty < 0.4, self.get_difficulty_prompt(difficulty)), constraints_json
+        )
+    
+    def _render_prompt_uncached(self, category: str, prompt_tier: Tuple, constraints_json: bytes) -> str:
+        """Render the prompt for a category, difficulty tier and serialised constraints"""
+        
+        if category == 'art':
             # Generate dynamic prompt using sophisticated framework
-            prompt = self.prompt_builder.build_art_prompt(difficulty_factors, constraints)
-            
-        else:
-            # Use original system for math/word puzzles (can be enhanced later)
-            difficulty_desc = self.get_difficulty_prompt(difficulty)
-            category_context = self.get_category_context(category)
-            
-            prompt = f"""
-            You are an expert puzzle creator for "The Daily Puzzle" game. Generate a {category} puzzle with {difficulty_desc}.
-            
-            Context: {category_context}
-            
-            Requirements:
-            - Create an engaging, fair puzzle appropriate for the difficulty level
-            - Ensure there is exactly one correct answer
-            - Make the puzzle solvable within 5 minutes for someone with appropriate skill level
-            - Avoid culturally specific references that might confuse international users
-            - For math: Show clear problem setup, avoid trick questions
-            - For word: Ensure wordplay is clever but not obscure
-            
-            Respond in this exact JSON format:
-            {{
-                "question": "The puzzle question/prompt",
-                "solution": "The exact correct answer", 
-                "explanation": "Clear explanation of how to solve it",
-                "hints": ["optional hint 1", "optional hint 2"],
-                "media_url": null,
-                "estimated_solve_time": 180,
-                "difficulty_justification": "Why this matches the requested difficulty"
-            }}
-            
-            Generate a high-quality puzzle now:
-            """
+            return self.prompt_builder.build_art_prompt(ArtDifficultyFactors(*prompt_tier))
         
-        if constraints and category != 'art':  # Art constraints handled by framework
-            prompt += f"\n\nAdditional Constraints: {json.dumps(constraints)}"
+        compact, difficulty_desc = prompt_tier
+        template = _MINIMAL_PROMPT_TEMPLATE if compact else _GENERIC_PROMPT_TEMPLATE
+        prompt = template.substitute(
+            category=category,
+            difficulty_desc=difficulty_desc,
+            category_context=self.get_category_context(category)
+        )
+        
+        if constraints_json:
+            prompt += f"\n\nAdditional Constraints: {constraints_json.decode()}"
         
         return prompt
     
-    async def _call_claude_api(self, prompt: str) -> str:
-        """Make API call to Claude"""
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop"""
         
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "anthropic-version": "2023-06-01"
-        }
+        loop = asyncio.get_running_loop()
+        client = cls._clients.get(loop)
+        if client is None or client.is_closed:
+            # HTTP/2 multiplexes concurrent requests over a few connections, so the pool stays small
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+            )
+            cls._clients[loop] = client
+        return client
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the pooled HTTP client for the running event loop"""
+        
+        client = cls._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+    
+    @classmethod
+    def close_idle_clients(cls) -> None:
+        """Close pooled clients whose event loops are still open but no longer running"""
+        
+        for loop, client in list(cls._clients.items()):
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(client.aclose())
+                del cls._clients[loop]
+    
+    def _select_model(self, difficulty: float) -> str:
+        """Pick the generation model; Mini-difficulty puzzles don't need the larger model"""
         
+        return self.fast_model if difficulty < 0.4 else self.model
+    
+    async def _call_claude_api(self, prompt: str, model: Optional[str] = None) -> str:
+        """Make API call to Claude, using the default model unless one is given"""
+        
+        # Stream the reply so the text is assembled while it is still arriving
         payload = {
-            "model": self.model,
-            "max_tokens": 1000,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            **self._payload_skeleton,
+            "stream": True,
+            "messages": [{"role": "user", "content": prompt}]
         }
+        if model is not None:
+            payload["model"] = model
+        # Serialised once; retries resend the same bytes
+        request_body = orjson.dumps(payload)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers=headers,
-                json=payload
-            )
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            async with self._rate_limiter:
+                async with self._get_client().stream(
+                    "POST",
+                    self.base_url,
+                    headers=self._headers,
+                    content=request_body
+                ) as response:
+                    if response.status_code == 200:
+                        return await self._read_message_stream(response)
+                    
+                    error_body = await self._read_error_body(response)
             
-            if response.status_code != 200:
-                raise PuzzleGenerationError(
-                    f"Claude API error {response.status_code}: {response.text}"
-                )
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                break
             
-            response_data = response.json()
-            return response_data["content"][0]["text"]
+            retry_delay = self._get_retry_delay(response, attempt)
+            self.logger.warning("Claude API rate limited, retrying in %.1fs", retry_delay)
+            await asyncio.sleep(retry_delay)
+        
+        raise PuzzleGenerationError(
+            f"Claude API error {response.status_code}: {error_body}"
+        )
+    
+    async def _call_claude_api_shared(self, prompt: str, model: Optional[str] = None) -> str:
+        """Make API call to Claude, sharing one in-flight request among concurrent identical prompts"""
+        
+        request_key = (asyncio.get_running_loop(), model, prompt)
+        request = self._inflight_requests.get(request_key)
+        if request is None:
+            request = asyncio.ensure_future(self._call_claude_api(prompt, model))
+            self._inflight_requests[request_key] = request
+            request.add_done_callback(lambda _: self._inflight_requests.pop(request_key, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(request)
+    
+    async def _read_message_stream(self, response: httpx.Response) -> str:
+        """Concatenate the text deltas of a streamed Messages API response"""
+        
+        text_parts = []
+        boundary = _JsonObjectBoundary()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            
+            event = orjson.loads(line[5:])
+            event_type = event["type"]
+            if event_type == "content_block_delta" and event["delta"]["type"] == "text_delta":
+                text = event["delta"]["text"]
+                text_parts.append(text)
+                # Only the first JSON object is parsed, so any commentary after it needn't be awaited
+                if boundary.feed(text):
+                    break
+            elif event_type == "message_stop":
+                break
+            elif event_type == "error":
+                raise PuzzleGenerationError(f"Claude API stream error: {event['error'].get('message', '')}")
+        
+        return "".join(text_parts)
+    
+    async def _read_error_body(self, response: httpx.Response) -> str:
+        """Read at most _MAX_ERROR_BODY_BYTES of a failed response's body"""
+        
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= _MAX_ERROR_BODY_BYTES:
+                break
+        
+        return body[:_MAX_ERROR_BODY_BYTES].decode(response.encoding or "utf-8", errors="replace")
+    
+    def _get_retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request"""
+        
+        try:
+            return float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            return float(2 ** attempt)
     
     def _parse_puzzle_response(self, response: str) -> Dict[str, Any]:
         """Parse Claude's response into puzzle data"""
         
         try:
-            # Extract JSON from response (Claude sometimes adds extra text)
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            
-            if start_idx == -1 or end_idx == 0:
-                raise ValueError("No JSON found in response")
-            
-            json_str = response[start_idx:end_idx]
-            
-            # Clean up the JSON string to handle Claude's formatting
-            import re
-            
-            # First try to parse as-is (for well-formatted JSON)
+            # First try to decode the first complete object as-is (for well-formatted JSON)
             try:
-                puzzle_data = json.loads(json_str)
+                puzzle_data = _decode_json_object(response)
             except json.JSONDecodeError as e:
                 # If that fails, clean up the formatting more aggressively
-                self.logger.warning(f"Initial JSON parse failed, cleaning: {str(e)}")
+                self.logger.warning("Initial JSON parse failed, cleaning: %s", e)
+                
+                json_str = response[response.find('{'):response.rfind('}') + 1]
                 
                 # More aggressive cleaning - remove all control characters and normalize
-                json_str_cleaned = re.sub(r'[\x00-\x1F\x7F]', ' ', json_str)  # Replace control chars with spaces
-                json_str_cleaned = re.sub(r'\s+', ' ', json_str_cleaned)  # Normalize whitespace
-                json_str_cleaned = json_str_cleaned.strip()
+                json_str_cleaned = json_str.translate(_CONTROL_CHARS_TO_SPACE)  # Replace control chars with spaces
+                json_str_cleaned = ' '.join(json_str_cleaned.split())  # Normalize whitespace and strip
                 
                 # Try parsing the cleaned version
                 try:
-                    puzzle_data = json.loads(json_str_cleaned)
-                except json.JSONDecodeError as e2:
+                    puzzle_data = orjson.loads(json_str_cleaned)
+                except orjson.JSONDecodeError as e2:
                     # Final attempt: try to extract just the core JSON structure
-                    self.logger.warning(f"Second JSON parse failed, attempting manual extraction: {str(e2)}")
+                    self.logger.warning("Second JSON parse failed, attempting manual extraction: %s", e2)
                     
                     # Look for question, solution, explanation patterns
-                    import ast
                     try:
                         # Use ast.literal_eval as a safer alternative
                         puzzle_data = ast.literal_eval(json_str_cleaned)
@@ -322,56 +666,28 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
                         # Last resort: manually parse the visible content
                         raise ValueError(f"Could not parse JSON after multiple attempts. Response: {json_str[:200]}...")
             
-            # Validate required fields
-            required_fields = ["question", "solution", "explanation"]
-            for field in required_fields:
-                if field not in puzzle_data:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Set defaults for optional fields
-            puzzle_data.setdefault("hints", [])
-            puzzle_data.setdefault("media_url", None)
-            puzzle_data.setdefault("estimated_solve_time", 180)
-            puzzle_data.setdefault("difficulty_justification", "Standard difficulty")
+            # Validate required fields in one set operation
+            if not isinstance(puzzle_data, dict):
+                raise ValueError("Response JSON is not an object")
+            missing_fields = _REQUIRED_PUZZLE_FIELDS.difference(puzzle_data)
+            if missing_fields:
+                raise ValueError(f"Missing required field: {', '.join(sorted(missing_fields))}")
             
-            # Set defaults for enhanced art puzzle fields
-            puzzle_data.setdefault("knowledge_verification", "Standard verification")
-            puzzle_data.setdefault("cultural_considerations", "Universal accessibility")
+            # Fill in defaults for optional fields in a single merge
+            return {**_PUZZLE_DEFAULTS, "hints": [], **puzzle_data}
             
-            return puzzle_data
-            
-        except (json.JSONDecodeError, ValueError) as e:
-            self.logger.error(f"Failed to parse puzzle response: {response}")
+        except ValueError as e:
+            self.logger.error("Failed to parse puzzle response: %s", response)
             raise PuzzleGenerationError(f"Invalid response format: {str(e)}")
     
     def _generate_mock_puzzle(self, category: str, difficulty: float) -> Dict[str, Any]:
         """Generate a mock puzzle for development/testing"""
         
-        mock_puzzles = {
-            'math': {
-                'question': 'If a train travels 60 miles in 45 minutes, what is its speed in miles per hour?',
-                'solution': '80 mph',
-                'explanation': 'Speed = Distance / Time. Convert 45 minutes to 0.75 hours: 60 miles / 0.75 hours = 80 mph'
-            },
-            'word': {
-                'question': 'What 7-letter word becomes longer when the third letter is removed?',
-                'solution': 'lounger',
-                'explanation': 'Remove the "u" from "lounger" to get "longer"'
-            },
-            'art': {
-                'question': 'Which famous painting technique creates the illusion of depth by making distant objects appear bluer and less distinct?',
-                'solution': 'atmospheric perspective',
-                'explanation': 'Atmospheric perspective mimics how the atmosphere affects our perception of distant objects'
-            }
-        }
-        
-        puzzle_template = mock_puzzles.get(category, mock_puzzles['math'])
+        puzzle_template = _MOCK_PUZZLES.get(category, _MOCK_PUZZLES['math'])
         
         return {
-            'question': puzzle_template['question'],
-            'solution': puzzle_template['solution'],
-            'explanation': puzzle_template['explanation'],
-            'hints': ['Think step by step', 'Consider the key concepts'],
+            **puzzle_template,
+            'hints': list(_MOCK_HINTS),
             'media_url': None,
             'estimated_solve_time': int(120 + (difficulty * 180)),  # 2-5 minutes based on difficulty
             'difficulty_justification': f'Mock puzzle at {difficulty} difficulty level'
@@ -389,32 +705,68 @@ class Claude4PuzzleGenerator(BasePuzzleGenerator):
         }
 
 
+# Loops that callers leave open (e.g. a management command's) still hold connections at exit
+atexit.register(Claude4PuzzleGenerator.close_idle_clients)
+
+_generator: Optional[Claude4PuzzleGenerator] = None
+
+
+def _get_generator() -> Claude4PuzzleGenerator:
+    """Return the generator shared by the synchronous wrappers"""
+    
+    # A race may build a spare instance; construction is idempotent, so no lock is needed
+    global _generator
+    if _generator is None:
+        _generator = Claude4PuzzleGenerator()
+    return _generator
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a generator coroutine to completion from synchronous code.
+    
+    The sync wrappers must not be called from async code: blocking on the call would stall
+    the caller's event loop for the whole API request, so that raises RuntimeError instead.
+    """
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "Claude sync wrappers cannot be called from a running event loop; "
+            "await the Claude4PuzzleGenerator method instead"
+        )
+    
+    async def _run() -> Any:
+        try:
+            return await coro
+        finally:
+            await Claude4PuzzleGenerator.aclose()
+    
+    # Fresh loop per call; its pooled client is closed before the loop is torn down
+    return asyncio.run(_run())
+
+
 # Synchronous wrapper for backwards compatibility
 def generate_claude_puzzle(category: str, difficulty: float) -> Dict[str, Any]:
     """Synchronous wrapper for Claude puzzle generation"""
     
-    generator = Claude4PuzzleGenerator()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    return _run_sync(_get_generator().generate_puzzle(category, difficulty))
+
+
+def generate_claude_puzzles(
+    requests: List[Tuple[str, float, Optional[Dict[str, Any]]]],
+    concurrency: int = 8
+) -> List[Any]:
+    """Synchronous wrapper for batch Claude puzzle generation"""
     
-    try:
-        return loop.run_until_complete(
-            generator.generate_puzzle(category, difficulty)
-        )
-    finally:
-        loop.close()
+    return _run_sync(_get_generator().generate_puzzles_batch(requests, concurrency))
 
 
 def validate_claude_puzzle(question: str, solution: str, category: str) -> Dict[str, Any]:
     """Synchronous wrapper for Claude puzzle validation"""
     
-    generator = Claude4PuzzleGenerator()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    try:
-        return loop.run_until_complete(
-            generator.validate_puzzle(question, solution, category)
-        )
-    finally:
-        loop.close()
\ No newline at end of file
+    return _run_sync(_get_generator().validate_puzzle(question, solution, category))
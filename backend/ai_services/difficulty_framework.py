@@ -6,7 +6,11 @@ specifically designed for art, culture, and creative puzzles.
 """
 
 from typing import Dict, Any, List, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
 from enum import Enum
 import json
 import logging
@@ -39,7 +43,33 @@ class CognitiveLoad(Enum):
     EVALUATION = "evaluation"  # "Why is this historically significant?"
 
 
-@dataclass
+# Domain difficulty mapping
+_DOMAIN_WEIGHTS = MappingProxyType({
+    KnowledgeDomain.UNIVERSAL: 0.1,
+    KnowledgeDomain.MAINSTREAM: 0.3,
+    KnowledgeDomain.EDUCATED: 0.5,
+    KnowledgeDomain.SPECIALIZED: 0.7,
+    KnowledgeDomain.EXPERT: 0.9
+})
+
+# Cultural scope difficulty
+_SCOPE_WEIGHTS = MappingProxyType({
+    CulturalScope.GLOBAL: 0.0,
+    CulturalScope.WESTERN: 0.2,
+    CulturalScope.REGIONAL: 0.4,
+    CulturalScope.NICHE: 0.6
+})
+
+# Cognitive load difficulty
+_COGNITIVE_WEIGHTS = MappingProxyType({
+    CognitiveLoad.RECOGNITION: 0.2,
+    CognitiveLoad.ANALYSIS: 0.4,
+    CognitiveLoad.SYNTHESIS: 0.6,
+    CognitiveLoad.EVALUATION: 0.8
+})
+
+
+@dataclass(frozen=True, slots=True)
 class ArtDifficultyFactors:
     """Comprehensive difficulty factors for art puzzles"""
     knowledge_domain: KnowledgeDomain
@@ -49,39 +79,16 @@ class ArtDifficultyFactors:
     technical_specificity: float  # 0.0 (general) to 1.0 (highly technical)
     interdisciplinary_complexity: float  # 0.0 (pure art) to 1.0 (multiple domains)
     
+    # Factors are frozen and come from a handful of tiers, so the score is memoised per value
+    @lru_cache(maxsize=64)
     def calculate_composite_difficulty(self) -> float:
         """Calculate weighted composite difficulty score (0.0-1.0)"""
         
-        # Domain difficulty mapping
-        domain_weights = {
-            KnowledgeDomain.UNIVERSAL: 0.1,
-            KnowledgeDomain.MAINSTREAM: 0.3,
-            KnowledgeDomain.EDUCATED: 0.5,
-            KnowledgeDomain.SPECIALIZED: 0.7,
-            KnowledgeDomain.EXPERT: 0.9
-        }
-        
-        # Cultural scope difficulty
-        scope_weights = {
-            CulturalScope.GLOBAL: 0.0,
-            CulturalScope.WESTERN: 0.2,
-            CulturalScope.REGIONAL: 0.4,
-            CulturalScope.NICHE: 0.6
-        }
-        
-        # Cognitive load difficulty
-        cognitive_weights = {
-            CognitiveLoad.RECOGNITION: 0.2,
-            CognitiveLoad.ANALYSIS: 0.4,
-            CognitiveLoad.SYNTHESIS: 0.6,
-            CognitiveLoad.EVALUATION: 0.8
-        }
-        
         # Weighted combination
         base_difficulty = (
-            domain_weights[self.knowledge_domain] * 0.4 +
-            scope_weights[self.cultural_scope] * 0.2 +
-            cognitive_weights[self.cognitive_load] * 0.3 +
+            _DOMAIN_WEIGHTS[self.knowledge_domain] * 0.4 +
+            _SCOPE_WEIGHTS[self.cultural_scope] * 0.2 +
+            _COGNITIVE_WEIGHTS[self.cognitive_load] * 0.3 +
             self.time_period_obscurity * 0.1
         )
         
@@ -94,6 +101,59 @@ class ArtDifficultyFactors:
         return round(final_difficulty, 3)
 
 
+# Upper bounds of the Mini Easy, Mini Hard, Mid Easy and Mid Hard tiers; anything above is Beast
+_TIER_THRESHOLDS = (0.25, 0.45, 0.65, 0.8)
+
+# Factors for each tier, built once and shared (instances are frozen)
+_TIER_FACTORS = (
+    # Mini Easy
+    ArtDifficultyFactors(
+        knowledge_domain=KnowledgeDomain.UNIVERSAL,
+        cultural_scope=CulturalScope.GLOBAL,
+        cognitive_load=CognitiveLoad.RECOGNITION,
+        time_period_obscurity=0.0,
+        technical_specificity=0.1,
+        interdisciplinary_complexity=0.0
+    ),
+    # Mini Hard
+    ArtDifficultyFactors(
+        knowledge_domain=KnowledgeDomain.MAINSTREAM,
+        cultural_scope=CulturalScope.GLOBAL,
+        cognitive_load=CognitiveLoad.RECOGNITION,
+        time_period_obscurity=0.2,
+        technical_specificity=0.2,
+        interdisciplinary_complexity=0.1
+    ),
+    # Mid Easy
+    ArtDifficultyFactors(
+        knowledge_domain=KnowledgeDomain.EDUCATED,
+        cultural_scope=CulturalScope.WESTERN,
+        cognitive_load=CognitiveLoad.ANALYSIS,
+        time_period_obscurity=0.4,
+        technical_specificity=0.4,
+        interdisciplinary_complexity=0.3
+    ),
+    # Mid Hard
+    ArtDifficultyFactors(
+        knowledge_domain=KnowledgeDomain.SPECIALIZED,
+        cultural_scope=CulturalScope.REGIONAL,
+        cognitive_load=CognitiveLoad.SYNTHESIS,
+        time_period_obscurity=0.6,
+        technical_specificity=0.6,
+        interdisciplinary_complexity=0.5
+    ),
+    # Beast
+    ArtDifficultyFactors(
+        knowledge_domain=KnowledgeDomain.EXPERT,
+        cultural_scope=CulturalScope.NICHE,
+        cognitive_load=CognitiveLoad.EVALUATION,
+        time_period_obscurity=0.8,
+        technical_specificity=0.8,
+        interdisciplinary_complexity=0.7
+    )
+)
+
+
 class ArtDifficultyCalibrator:
     """Calibrates difficulty based on target difficulty and historical performance"""
     
@@ -103,54 +163,8 @@ class ArtDifficultyCalibrator:
     def generate_difficulty_factors(self, target_difficulty: float, constraints: Dict[str, Any] = None) -> ArtDifficultyFactors:
         """Generate appropriate difficulty factors for target difficulty level"""
         
-        constraints = constraints or {}
-        
-        # Define difficulty thresholds
-        if target_difficulty < 0.25:  # Mini Easy
-            return ArtDifficultyFactors(
-                knowledge_domain=KnowledgeDomain.UNIVERSAL,
-                cultural_scope=CulturalScope.GLOBAL,
-                cognitive_load=CognitiveLoad.RECOGNITION,
-                time_period_obscurity=0.0,
-                technical_specificity=0.1,
-                interdisciplinary_complexity=0.0
-            )
-        elif target_difficulty < 0.45:  # Mini Hard
-            return ArtDifficultyFactors(
-                knowledge_domain=KnowledgeDomain.MAINSTREAM,
-                cultural_scope=CulturalScope.GLOBAL,
-                cognitive_load=CognitiveLoad.RECOGNITION,
-                time_period_obscurity=0.2,
-                technical_specificity=0.2,
-                interdisciplinary_complexity=0.1
-            )
-        elif target_difficulty < 0.65:  # Mid Easy
-            return ArtDifficultyFactors(
-                knowledge_domain=KnowledgeDomain.EDUCATED,
-                cultural_scope=CulturalScope.WESTERN,
-                cognitive_load=CognitiveLoad.ANALYSIS,
-                time_period_obscurity=0.4,
-                technical_specificity=0.4,
-                interdisciplinary_complexity=0.3
-            )
-        elif target_difficulty < 0.8:  # Mid Hard
-            return ArtDifficultyFactors(
-                knowledge_domain=KnowledgeDomain.SPECIALIZED,
-                cultural_scope=CulturalScope.REGIONAL,
-                cognitive_load=CognitiveLoad.SYNTHESIS,
-                time_period_obscurity=0.6,
-                technical_specificity=0.6,
-                interdisciplinary_complexity=0.5
-            )
-        else:  # Beast
-            return ArtDifficultyFactors(
-                knowledge_domain=KnowledgeDomain.EXPERT,
-                cultural_scope=CulturalScope.NICHE,
-                cognitive_load=CognitiveLoad.EVALUATION,
-                time_period_obscurity=0.8,
-                technical_specificity=0.8,
-                interdisciplinary_complexity=0.7
-            )
+        # A target equal to a threshold belongs to the tier above it, hence bisect_right
+        return _TIER_FACTORS[bisect_right(_TIER_THRESHOLDS, target_difficulty)]
     
     def validate_difficulty_match(self, factors: ArtDifficultyFactors, target_difficulty: float, tolerance: float = 0.15) -> bool:
         """Validate that generated factors produce difficulty within tolerance of target"""
@@ -178,84 +192,99 @@ class ArtDifficultyCalibrator:
             interdisciplinary_complexity=min(1.0, factors.interdisciplinary_complexity * adjustment_factor)
         )
         
-        logger.info(f"Adjusted difficulty factors based on solve rate {solve_rate:.2f}")
+        logger.info("Adjusted difficulty factors based on solve rate %.2f", solve_rate)
         return new_factors
 
 
-class DynamicPromptBuilder:
-    """Builds dynamic prompts based on difficulty factors and context"""
-    
-    def __init__(self):
-        self.art_domains = {
-            "visual_arts": ["painting", "sculpture", "photography", "printmaking"],
-            "music": ["classical", "popular", "jazz", "world_music", "composition"],
-            "film": ["directors", "cinematography", "film_movements", "genre_theory"],
-            "architecture": ["styles", "architects", "structural_elements", "periods"],
-            "cultural": ["art_movements", "cultural_context", "patronage", "influence"]
-        }
-        
-        self.difficulty_templates = {
-            "recognition": {
-                "easy": "Who {action} this famous {item}?",
-                "medium": "Which {creator_type} is known for {specific_trait}?",
-                "hard": "Identify the {creator_type} of this {description}"
-            },
-            "analysis": {
-                "easy": "What {technique} is primarily used in {context}?",
-                "medium": "Which {movement} emphasized {characteristics}?",
-                "hard": "Analyze the {aspect} that distinguishes {comparison}"
-            },
-            "synthesis": {
-                "easy": "How do {element1} and {element2} relate in {context}?",
-                "medium": "What connection exists between {concept1} and {concept2}?",
-                "hard": "Synthesize the relationship between {complex_concept1} and {complex_concept2}"
-            }
-        }
-    
-    def build_art_prompt(self, factors: ArtDifficultyFactors, category_constraints: Dict[str, Any] = None) -> str:
-        """Build sophisticated prompt for art puzzle generation"""
-        
-        category_constraints = category_constraints or {}
-        target_difficulty = factors.calculate_composite_difficulty()
-        
-        # Knowledge domain context
-        domain_context = self._get_domain_context(factors.knowledge_domain)
-        
-        # Cultural scope guidelines
-        scope_guidelines = self._get_scope_guidelines(factors.cultural_scope)
-        
-        # Cognitive load instructions
-        cognitive_instructions = self._get_cognitive_instructions(factors.cognitive_load)
-        
-        # Time period context
-        period_context = self._get_period_context(factors.time_period_obscurity)
-        
-        # Technical specificity requirements
-        technical_reqs = self._get_technical_requirements(factors.technical_specificity)
-        
-        # Build comprehensive prompt
-        prompt = f"""
+_ART_DOMAINS = MappingProxyType({
+    "visual_arts": ("painting", "sculpture", "photography", "printmaking"),
+    "music": ("classical", "popular", "jazz", "world_music", "composition"),
+    "film": ("directors", "cinematography", "film_movements", "genre_theory"),
+    "architecture": ("styles", "architects", "structural_elements", "periods"),
+    "cultural": ("art_movements", "cultural_context", "patronage", "influence")
+})
+
+_DIFFICULTY_TEMPLATES = MappingProxyType({
+    "recognition": MappingProxyType({
+        "easy": "Who {action} this famous {item}?",
+        "medium": "Which {creator_type} is known for {specific_trait}?",
+        "hard": "Identify the {creator_type} of this {description}"
+    }),
+    "analysis": MappingProxyType({
+        "easy": "What {technique} is primarily used in {context}?",
+        "medium": "Which {movement} emphasized {characteristics}?",
+        "hard": "Analyze the {aspect} that distinguishes {comparison}"
+    }),
+    "synthesis": MappingProxyType({
+        "easy": "How do {element1} and {element2} relate in {context}?",
+        "medium": "What connection exists between {concept1} and {concept2}?",
+        "hard": "Synthesize the relationship between {complex_concept1} and {complex_concept2}"
+    })
+})
+
+# Knowledge domain context
+_DOMAIN_CONTEXTS = MappingProxyType({
+    KnowledgeDomain.UNIVERSAL: "Knowledge Domain: Focus on globally recognized masterpieces and artists known worldwide (Da Vinci, Picasso, etc.)",
+    KnowledgeDomain.MAINSTREAM: "Knowledge Domain: Include well-known artists and works familiar to educated audiences (Van Gogh, Impressionism, etc.)",
+    KnowledgeDomain.EDUCATED: "Knowledge Domain: Draw from art history knowledge expected of college-educated individuals (specific movements, techniques)",
+    KnowledgeDomain.SPECIALIZED: "Knowledge Domain: Require specialized knowledge of specific periods, regional traditions, or technical aspects",
+    KnowledgeDomain.EXPERT: "Knowledge Domain: Demand expert-level knowledge of art theory, obscure periods, or highly specialized techniques"
+})
+
+# Cultural scope guidelines
+_SCOPE_GUIDELINES = MappingProxyType({
+    CulturalScope.GLOBAL: "Cultural Scope: Use universally recognized cultural references accessible to international audiences",
+    CulturalScope.WESTERN: "Cultural Scope: Focus on Western art traditions but ensure broad accessibility within that tradition",
+    CulturalScope.REGIONAL: "Cultural Scope: May include region-specific knowledge (European, Asian, etc.) with context provided",
+    CulturalScope.NICHE: "Cultural Scope: Can reference specialized cultural knowledge with appropriate background context"
+})
+
+# Cognitive load instructions
+_COGNITIVE_INSTRUCTIONS = MappingProxyType({
+    CognitiveLoad.RECOGNITION: "Cognitive Requirement: Create identification/recognition questions requiring factual recall",
+    CognitiveLoad.ANALYSIS: "Cognitive Requirement: Require analysis of techniques, styles, or characteristics",
+    CognitiveLoad.SYNTHESIS: "Cognitive Requirement: Demand synthesis of multiple concepts or comparison of elements",
+    CognitiveLoad.EVALUATION: "Cognitive Requirement: Require evaluation of significance, influence, or artistic merit"
+})
+
+# Time period context by obscurity bucket (below 0.3, below 0.6, the rest)
+_PERIOD_THRESHOLDS = (0.3, 0.6)
+_PERIOD_CONTEXTS = (
+    "Time Period: Focus on well-known periods (Renaissance, Impressionism, Classical, etc.)",
+    "Time Period: Include moderately known periods with some context provided",
+    "Time Period: May reference lesser-known periods but provide sufficient historical context"
+)
+
+# Technical level by specificity bucket (below 0.3, below 0.6, the rest)
+_TECHNICAL_THRESHOLDS = (0.3, 0.6)
+_TECHNICAL_REQUIREMENTS = (
+    "Technical Level: Use general art terminology accessible to educated audiences",
+    "Technical Level: Include specific techniques or terminology with context provided",
+    "Technical Level: May use specialized terminology but ensure clarity and context"
+)
+
+# Period and technical guidance is only included at or above these levels
+_MIN_GUIDED_OBSCURITY = 0.1
+_MIN_GUIDED_SPECIFICITY = 0.15
+
+# Blank line between content guideline paragraphs, at the template's indentation
+_GUIDELINE_SEPARATOR = "\n        \n        "
+
+# Stripped once here, so rendered prompts need no further copy
+_ART_PROMPT_TEMPLATE = Template("""
         You are an expert art puzzle creator for "The Daily Puzzle" game. Generate a sophisticated art puzzle with precise difficulty calibration.
 
         DIFFICULTY SPECIFICATION:
-        - Target Difficulty: {target_difficulty:.3f} (on 0.0-1.0 scale)
-        - Knowledge Domain: {factors.knowledge_domain.value} 
-        - Cultural Scope: {factors.cultural_scope.value}
-        - Cognitive Load: {factors.cognitive_load.value}
-        - Time Period Obscurity: {factors.time_period_obscurity:.2f}
-        - Technical Specificity: {factors.technical_specificity:.2f}
-        - Interdisciplinary Complexity: {factors.interdisciplinary_complexity:.2f}
+        - Target Difficulty: $target_difficulty (on 0.0-1.0 scale)
+        - Knowledge Domain: $knowledge_domain 
+        - Cultural Scope: $cultural_scope
+        - Cognitive Load: $cognitive_load
+        - Time Period Obscurity: $time_period_obscurity
+        - Technical Specificity: $technical_specificity
+        - Interdisciplinary Complexity: $interdisciplinary_complexity
 
         CONTENT GUIDELINES:
-        {domain_context}
-        
-        {scope_guidelines}
-        
-        {cognitive_instructions}
-        
-        {period_context}
-        
-        {technical_reqs}
+        $content_guidelines
 
         QUALITY REQUIREMENTS:
         - Ensure factual accuracy and verifiable answers
@@ -265,75 +294,73 @@ class DynamicPromptBuilder:
         - Balance challenge with solvability for the target difficulty
 
         DIFFICULTY VALIDATION:
-        The puzzle should be solvable by approximately {self._estimate_solve_percentage(target_difficulty):.0f}% of players familiar with art.
-        Estimated solve time: {self._estimate_solve_time(target_difficulty)} minutes.
+        The puzzle should be solvable by approximately ${solve_percentage}% of players familiar with art.
+        Estimated solve time: $solve_time minutes.
 
         Respond in this exact JSON format:
-        {{
+        {
             "question": "The sophisticated art puzzle question",
             "solution": "The precise correct answer",
             "explanation": "Detailed explanation including artistic/cultural context",
             "hints": ["strategic hint 1", "strategic hint 2"],
             "media_url": null,
-            "estimated_solve_time": {self._estimate_solve_time(target_difficulty) * 60},
+            "estimated_solve_time": $solve_time_seconds,
             "difficulty_justification": "Detailed analysis of why this matches the difficulty factors",
             "knowledge_verification": "How to verify this answer (sources, references)",
             "cultural_considerations": "Any cultural context important for understanding"
-        }}
+        }
 
         Generate the art puzzle now:
-        """
-        
-        return prompt.strip()
-    
-    def _get_domain_context(self, domain: KnowledgeDomain) -> str:
-        """Get context based on knowledge domain"""
-        contexts = {
-            KnowledgeDomain.UNIVERSAL: "Focus on globally recognized masterpieces and artists known worldwide (Da Vinci, Picasso, etc.)",
-            KnowledgeDomain.MAINSTREAM: "Include well-known artists and works familiar to educated audiences (Van Gogh, Impressionism, etc.)",
-            KnowledgeDomain.EDUCATED: "Draw from art history knowledge expected of college-educated individuals (specific movements, techniques)",
-            KnowledgeDomain.SPECIALIZED: "Require specialized knowledge of specific periods, regional traditions, or technical aspects",
-            KnowledgeDomain.EXPERT: "Demand expert-level knowledge of art theory, obscure periods, or highly specialized techniques"
-        }
-        return f"Knowledge Domain: {contexts[domain]}"
+        """.strip())
+
+
+class DynamicPromptBuilder:
+    """Builds dynamic prompts based on difficulty factors and context"""
     
-    def _get_scope_guidelines(self, scope: CulturalScope) -> str:
-        """Get cultural scope guidelines"""
-        guidelines = {
-            CulturalScope.GLOBAL: "Use universally recognized cultural references accessible to international audiences",
-            CulturalScope.WESTERN: "Focus on Western art traditions but ensure broad accessibility within that tradition",
-            CulturalScope.REGIONAL: "May include region-specific knowledge (European, Asian, etc.) with context provided",
-            CulturalScope.NICHE: "Can reference specialized cultural knowledge with appropriate background context"
-        }
-        return f"Cultural Scope: {guidelines[scope]}"
+    def __init__(self):
+        self.art_domains = _ART_DOMAINS
+        self.difficulty_templates = _DIFFICULTY_TEMPLATES
     
-    def _get_cognitive_instructions(self, load: CognitiveLoad) -> str:
-        """Get cognitive load instructions"""
-        instructions = {
-            CognitiveLoad.RECOGNITION: "Create identification/recognition questions requiring factual recall",
-            CognitiveLoad.ANALYSIS: "Require analysis of techniques, styles, or characteristics",
-            CognitiveLoad.SYNTHESIS: "Demand synthesis of multiple concepts or comparison of elements",
-            CognitiveLoad.EVALUATION: "Require evaluation of significance, influence, or artistic merit"
-        }
-        return f"Cognitive Requirement: {instructions[load]}"
+    def build_art_prompt(self, factors: ArtDifficultyFactors, category_constraints: Dict[str, Any] = None) -> str:
+        """Build sophisticated prompt for art puzzle generation"""
+        
+        category_constraints = category_constraints or {}
+        target_difficulty = factors.calculate_composite_difficulty()
+        solve_time = self._estimate_solve_time(target_difficulty)
+        
+        guidelines = [
+            _DOMAIN_CONTEXTS[factors.knowledge_domain],
+            _SCOPE_GUIDELINES[factors.cultural_scope],
+            _COGNITIVE_INSTRUCTIONS[factors.cognitive_load]
+        ]
+        # Near-zero modifiers add no guidance beyond the specification above, so leave them out
+        if factors.time_period_obscurity >= _MIN_GUIDED_OBSCURITY:
+            guidelines.append(self._get_period_context(factors.time_period_obscurity))
+        if factors.technical_specificity >= _MIN_GUIDED_SPECIFICITY:
+            guidelines.append(self._get_technical_requirements(factors.technical_specificity))
+        
+        # Build comprehensive prompt
+        return _ART_PROMPT_TEMPLATE.substitute(
+            target_difficulty=f"{target_difficulty:.3f}",
+            knowledge_domain=factors.knowledge_domain.value,
+            cultural_scope=factors.cultural_scope.value,
+            cognitive_load=factors.cognitive_load.value,
+            time_period_obscurity=f"{factors.time_period_obscurity:.2f}",
+            technical_specificity=f"{factors.technical_specificity:.2f}",
+            interdisciplinary_complexity=f"{factors.interdisciplinary_complexity:.2f}",
+            content_guidelines=_GUIDELINE_SEPARATOR.join(guidelines),
+            solve_percentage=f"{self._estimate_solve_percentage(target_difficulty):.0f}",
+            solve_time=solve_time,
+            solve_time_seconds=solve_time * 60
+        )
     
     def _get_period_context(self, obscurity: float) -> str:
         """Get time period context based on obscurity level"""
-        if obscurity < 0.3:
-            return "Time Period: Focus on well-known periods (Renaissance, Impressionism, Classical, etc.)"
-        elif obscurity < 0.6:
-            return "Time Period: Include moderately known periods with some context provided"
-        else:
-            return "Time Period: May reference lesser-known periods but provide sufficient historical context"
+        return _PERIOD_CONTEXTS[bisect_right(_PERIOD_THRESHOLDS, obscurity)]
     
     def _get_technical_requirements(self, specificity: float) -> str:
         """Get technical specificity requirements"""
-        if specificity < 0.3:
-            return "Technical Level: Use general art terminology accessible to educated audiences"
-        elif specificity < 0.6:
-            return "Technical Level: Include specific techniques or terminology with context provided"
-        else:
-            return "Technical Level: May use specialized terminology but ensure clarity and context"
+        return _TECHNICAL_REQUIREMENTS[bisect_right(_TECHNICAL_THRESHOLDS, specificity)]
     
     def _estimate_solve_percentage(self, difficulty: float) -> float:
         """Estimate percentage of target audience that should solve this"""
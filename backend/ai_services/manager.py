@@ -1,22 +1,49 @@
-import random
-from typing import Dict, Any, Optional, List
+import asyncio
+import copy
+import hashlib
+import re
+from typing import Dict, Any, Optional, List, Tuple
 from django.conf import settings
-from datetime import date, datetime
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import date
 from .base import PuzzleGenerationError
-from .claude import Claude4PuzzleGenerator
+from .claude import _get_generator as _get_claude_generator
 from .difficulty_framework import ArtDifficultyCalibrator
-from .art_validation import ArtPuzzleValidator
+from .art_validation import _get_validator as _get_art_validator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Event loops created after this point (the per-request loops in views and tasks) use uvloop when it is installed
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Placeholder text a model sometimes returns instead of real content; not worth an API validation call
+_PLACEHOLDER_RE = re.compile(r"\s*(?:todo|fixme|tbd|n/a|\.\.\.|lorem ipsum\b.*)?\s*", re.IGNORECASE | re.DOTALL)
+
+
+def _puzzle_text_fields(puzzle_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Return a puzzle's question, solution and category in one pass"""
+    
+    question = puzzle_data.get('question')
+    if question is None:
+        # Stored puzzles keep the question inside puzzle_content; only look there when needed
+        puzzle_content = puzzle_data.get('puzzle_content')
+        question = puzzle_content.get('question', '') if puzzle_content else ''
+    return question, puzzle_data.get('solution', ''), puzzle_data.get('category', '')
+
 
 class PuzzleGenerationService:
     """Service that manages puzzle generation across all AI models"""
     
     def __init__(self):
+        # Generators and validators are process-wide, so every service instance shares their caches
         self.generators = {
-            'claude4': Claude4PuzzleGenerator(),
+            'claude4': _get_claude_generator(),
             # Will add GPT-5 and Gemini generators later
         }
         self.categories = getattr(settings, 'PUZZLE_CATEGORIES', ['math', 'word', 'art'])
@@ -24,7 +51,10 @@ class PuzzleGenerationService:
         
         # Initialize sophisticated validation systems
         self.art_difficulty_calibrator = ArtDifficultyCalibrator()
-        self.art_validator = ArtPuzzleValidator()
+        self.art_validator = _get_art_validator()
+        
+        # Daily puzzle generations currently running, keyed by event loop and cache key
+        self._inflight_puzzles: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
     
     async def generate_daily_puzzle(
         self, 
@@ -44,28 +74,74 @@ class PuzzleGenerationService:
             Complete puzzle data ready for database storage
         """
         
+        cache_timeout = settings.DAILY_PUZZLE_CACHE_TIMEOUT
+        if not cache_timeout:
+            return await self._generate_daily_puzzle_uncached(puzzle_date, category, difficulty)
+        
+        cache_key = f"daily_puzzle:{puzzle_date.isoformat()}:{category}:{round(difficulty, 3)}"
+        cached_puzzle = await cache.aget(cache_key)
+        if cached_puzzle is not None:
+            logger.info("Reused cached %s puzzle for %s", category, puzzle_date)
+            return cached_puzzle
+        
+        # Concurrent requests for the same puzzle share one generation
+        request_key = (asyncio.get_running_loop(), cache_key)
+        request = self._inflight_puzzles.get(request_key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._generate_and_cache_daily_puzzle(puzzle_date, category, difficulty, cache_key, cache_timeout)
+            )
+            self._inflight_puzzles[request_key] = request
+            request.add_done_callback(lambda _: self._inflight_puzzles.pop(request_key, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the generation for the others;
+        # each caller gets its own copy since callers may modify the puzzle
+        return copy.deepcopy(await asyncio.shield(request))
+    
+    async def _generate_and_cache_daily_puzzle(
+        self,
+        puzzle_date: date,
+        category: str,
+        difficulty: float,
+        cache_key: str,
+        cache_timeout: int
+    ) -> Dict[str, Any]:
+        """Generate a daily puzzle and store it under `cache_key`"""
+        
+        puzzle_data = await self._generate_daily_puzzle_uncached(puzzle_date, category, difficulty)
+        await cache.aset(cache_key, puzzle_data, cache_timeout)
+        return puzzle_data
+    
+    async def _generate_daily_puzzle_uncached(
+        self, 
+        puzzle_date: date, 
+        category: str, 
+        difficulty: float
+    ) -> Dict[str, Any]:
+        """Generate a daily puzzle without consulting the daily puzzle cache"""
+        
         # Determine which model should generate today's puzzle
         model_name = self._get_model_for_date(puzzle_date, category)
         
         if model_name not in self.generators:
-            logger.warning(f"Model {model_name} not available, falling back to claude4")
+            logger.warning("Model %s not available, falling back to claude4", model_name)
             model_name = 'claude4'
         
         generator = self.generators[model_name]
         
         try:
-            logger.info(f"Generating {category} puzzle for {puzzle_date} using {model_name}")
+            logger.info("Generating %s puzzle for %s using %s", category, puzzle_date, model_name)
             
             # Generate the puzzle
             puzzle_data = await generator.generate_puzzle(category, difficulty)
             
             # Add metadata
             puzzle_data.update({
-                'id': puzzle_date.strftime('%Y-%m-%d'),
+                'id': puzzle_date.isoformat(),
                 'category': category,
                 'difficulty': difficulty,
                 'generator_model': model_name,
-                'created_at': datetime.now(),
+                'created_at': timezone.now(),
                 'is_active': True
             })
             
@@ -82,7 +158,7 @@ class PuzzleGenerationService:
             if not validation_result['is_valid']:
                 # Log detailed validation issues for debugging
                 issues = validation_result.get('issues', [])
-                logger.warning(f"Puzzle validation failed for {puzzle_date}: {issues}")
+                logger.warning("Puzzle validation failed for %s: %s", puzzle_date, issues)
                 
                 # For development, we might want to continue with warnings rather than hard failures
                 if validation_result.get('overall_score', 0) >= 0.5:
@@ -96,11 +172,11 @@ class PuzzleGenerationService:
                 model_name: validation_result
             }
             
-            logger.info(f"Successfully generated validated puzzle for {puzzle_date}")
+            logger.info("Successfully generated validated puzzle for %s", puzzle_date)
             return puzzle_data
             
         except Exception as e:
-            logger.error(f"Failed to generate puzzle for {puzzle_date}: {str(e)}")
+            logger.error("Failed to generate puzzle for %s: %s", puzzle_date, e)
             raise PuzzleGenerationError(f"Puzzle generation failed: {str(e)}")
     
     async def validate_existing_puzzle(
@@ -118,23 +194,25 @@ class PuzzleGenerationService:
         """
         
         results = {}
-        question = puzzle_data.get('question', puzzle_data.get('puzzle_content', {}).get('question', ''))
-        solution = puzzle_data.get('solution', '')
-        category = puzzle_data.get('category', '')
+        question, solution, category = _puzzle_text_fields(puzzle_data)
         
-        for model_name, generator in self.generators.items():
-            try:
-                result = await generator.validate_puzzle(question, solution, category)
-                results[model_name] = result
-                logger.info(f"Validated puzzle with {model_name}: confidence {result.get('confidence', 0)}")
-                
-            except Exception as e:
-                logger.error(f"Validation failed with {model_name}: {str(e)}")
+        # Validators are independent API calls, so run them concurrently
+        validations = await asyncio.gather(
+            *(generator.validate_puzzle(question, solution, category) for generator in self.generators.values()),
+            return_exceptions=True
+        )
+        
+        for model_name, result in zip(self.generators, validations):
+            if isinstance(result, Exception):
+                logger.error("Validation failed with %s: %s", model_name, result)
                 results[model_name] = {
                     'is_valid': False,
                     'confidence': 0.0,
-                    'issues': [f"Validation error: {str(e)}"]
+                    'issues': [f"Validation error: {str(result)}"]
                 }
+            else:
+                results[model_name] = result
+                logger.info("Validated puzzle with %s: confidence %s", model_name, result.get('confidence', 0))
         
         return results
     
@@ -145,15 +223,14 @@ class PuzzleGenerationService:
     def _get_model_for_date(self, puzzle_date: date, category: str) -> str:
         """Determine which AI model should generate the puzzle for a given date"""
         
-        # Use date and category to create a deterministic but varied rotation
-        seed = puzzle_date.toordinal() + hash(category)
-        random.seed(seed)
-        
         available_models = [m for m in self.models if m in self.generators]
         if not available_models:
             return 'claude4'  # Fallback
         
-        return random.choice(available_models)
+        # Use date and category to create a deterministic but varied rotation; a stable digest
+        # (unlike the salted built-in hash) picks the same model in every worker process
+        digest = hashlib.blake2b(f"{puzzle_date.toordinal()}:{category}".encode(), digest_size=8).digest()
+        return available_models[int.from_bytes(digest, 'big') % len(available_models)]
     
     async def _validate_art_puzzle_quality(
         self, 
@@ -169,43 +246,48 @@ class PuzzleGenerationService:
                 target_difficulty
             )
             
-            # Use comprehensive art validation
-            validation = self.art_validator.validate_art_puzzle(
-                puzzle_data, difficulty_factors, target_difficulty
+            # Run the rule-based art validation off the event loop while the AI validation
+            # request is in flight; AI failures are reported alongside the art validation.
+            # A regenerated puzzle identical to an earlier one reuses its art validation
+            validation, ai_validation = await asyncio.gather(
+                asyncio.to_thread(
+                    self.art_validator.validate_art_puzzle_cached,
+                    puzzle_data, difficulty_factors, target_difficulty
+                ),
+                generator.validate_puzzle(*_puzzle_text_fields(puzzle_data)),
+                return_exceptions=True
             )
+            if isinstance(validation, Exception):
+                raise validation
             
-            # Convert ArtPuzzleValidation to dict format expected by existing code
+            # Convert ArtPuzzleValidation to dict format expected by existing code; the cached
+            # validation is shared, so the puzzle gets its own copies of its dicts
             result = {
                 'is_valid': validation.is_valid,
                 'overall_score': validation.overall_score,
                 'confidence': validation.overall_score,  # Use overall score as confidence
                 'issues': [issue.message for issue in validation.issues],
-                'quality_metrics': validation.quality_metrics,
-                'difficulty_assessment': validation.difficulty_assessment,
-                'cultural_accessibility': validation.cultural_accessibility
+                'quality_metrics': dict(validation.quality_metrics),
+                'difficulty_assessment': copy.deepcopy(validation.difficulty_assessment),
+                'cultural_accessibility': dict(validation.cultural_accessibility)
             }
             
-            # Also get basic AI validation for comparison
-            try:
-                ai_validation = await generator.validate_puzzle(
-                    puzzle_data.get('question', ''),
-                    puzzle_data.get('solution', ''),
-                    puzzle_data.get('category', '')
-                )
+            # Also include basic AI validation for comparison
+            if isinstance(ai_validation, Exception):
+                logger.warning("AI validation failed: %s", ai_validation)
+                result['ai_validation'] = {'error': str(ai_validation)}
+            else:
                 result['ai_validation'] = ai_validation
-            except Exception as e:
-                logger.warning(f"AI validation failed: {str(e)}")
-                result['ai_validation'] = {'error': str(e)}
             
             logger.info(
-                f"Art puzzle validation: score={validation.overall_score:.2f}, "
-                f"valid={validation.is_valid}, issues={len(validation.issues)}"
+                "Art puzzle validation: score=%.2f, valid=%s, issues=%d",
+                validation.overall_score, validation.is_valid, len(validation.issues)
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"Art puzzle validation failed: {str(e)}")
+            logger.error("Art puzzle validation failed: %s", e)
             return {
                 'is_valid': False,
                 'confidence': 0.0,
@@ -220,9 +302,7 @@ class PuzzleGenerationService:
     ) -> Dict[str, Any]:
         """Validate that the generated puzzle meets quality standards (non-art puzzles)"""
         
-        question = puzzle_data.get('question', '')
-        solution = puzzle_data.get('solution', '')
-        category = puzzle_data.get('category', '')
+        question, solution, category = _puzzle_text_fields(puzzle_data)
         
         # Basic validation checks
         if not question or not solution:
@@ -232,6 +312,13 @@ class PuzzleGenerationService:
                 'issues': ['Missing question or solution']
             }
         
+        if _PLACEHOLDER_RE.fullmatch(str(question)) or _PLACEHOLDER_RE.fullmatch(str(solution)):
+            return {
+                'is_valid': False,
+                'confidence': 0.0,
+                'issues': ['Placeholder content detected']
+            }
+        
         if len(question) < 10:
             return {
                 'is_valid': False,
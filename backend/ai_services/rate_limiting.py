@@ -0,0 +1,40 @@
+"""
+Request Rate Limiting for AI Provider APIs
+
+Keeps concurrent puzzle generation under a provider's request-rate limit
+so batched calls queue locally instead of bouncing off 429 responses.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter: `max_rate` requests per `time_period` seconds, bursting up to `max_rate`"""
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._interval = time_period / max_rate
+        self._burst_window = time_period - self._interval
+        self._next_free = 0.0
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent under the configured rate"""
+        
+        # Reserve the slot before sleeping; there is no await in between, so this is safe
+        # across concurrent tasks and doesn't tie the limiter to a single event loop
+        now = time.monotonic()
+        slot = max(self._next_free, now)
+        self._next_free = slot + self._interval
+        
+        delay = slot - self._burst_window - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
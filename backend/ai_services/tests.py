@@ -0,0 +1,126 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from .art_validation import ArtPuzzleValidator, _validate_from_key
+from .claude import Claude4PuzzleGenerator, validate_claude_puzzle
+from .manager import PuzzleGenerationService
+
+
+@override_settings(PUZZLE_VALIDATION_CACHE_TIMEOUT=60)
+class ValidationCacheTests(SimpleTestCase):
+    """Claude validation results reused through the validation cache"""
+    
+    def setUp(self):
+        cache.clear()
+        self.generator = Claude4PuzzleGenerator()
+        self.generator.mock_mode = False
+        self.api_call = mock.AsyncMock(return_value='{"is_valid": true, "confidence": 0.9}')
+        self.generator._call_claude_api_shared = self.api_call
+    
+    async def test_numeric_solution(self):
+        validation = await self.generator.validate_puzzle("What is 6 + 7?", 13, "math")
+        
+        self.assertTrue(validation['is_valid'])
+        self.assertEqual(validation['confidence'], 0.9)
+    
+    async def test_revalidation_reuses_cached_result(self):
+        await self.generator.validate_puzzle("What is 6 + 7?", 13, "math")
+        validation = await self.generator.validate_puzzle("What is 6 + 7? ", "13", "math")
+        
+        self.assertTrue(validation['is_valid'])
+        self.api_call.assert_awaited_once()
+    
+    async def test_other_generator_does_not_reuse_result(self):
+        other_generator = type("OtherGenerator", (Claude4PuzzleGenerator,), {})()
+        other_generator.mock_mode = False
+        other_generator._call_claude_api_shared = self.api_call
+        
+        await self.generator.validate_puzzle("What is 6 + 7?", 13, "math")
+        await other_generator.validate_puzzle("What is 6 + 7?", 13, "math")
+        
+        self.assertEqual(self.api_call.await_count, 2)
+
+
+class PuzzleQualityTests(SimpleTestCase):
+    """Quality checks run on non-art puzzles before they are accepted"""
+    
+    def setUp(self):
+        self.service = PuzzleGenerationService()
+        self.generator = mock.Mock()
+        self.generator.validate_puzzle = mock.AsyncMock(return_value={'is_valid': True, 'confidence': 0.9})
+    
+    async def test_numeric_solution(self):
+        puzzle_data = {'question': "What is 6 + 7?", 'solution': 13, 'category': 'math'}
+        validation = await self.service._validate_puzzle_quality(puzzle_data, self.generator)
+        
+        self.assertTrue(validation['is_valid'])
+        self.generator.validate_puzzle.assert_awaited_once()
+    
+    async def test_placeholder_solution_skips_validation_call(self):
+        puzzle_data = {'question': "What is the capital of France?", 'solution': "TODO", 'category': 'word'}
+        validation = await self.service._validate_puzzle_quality(puzzle_data, self.generator)
+        
+        self.assertFalse(validation['is_valid'])
+        self.assertEqual(validation['issues'], ['Placeholder content detected'])
+        self.generator.validate_puzzle.assert_not_awaited()
+
+
+class ArtPuzzleQualityTests(SimpleTestCase):
+    """Rule-based and AI validation of art puzzles"""
+    
+    puzzle_data = {
+        'question': "Which Dutch painter, famous for his expressive brush technique, painted The Starry Night?",
+        'solution': "Vincent van Gogh",
+        'explanation': "Van Gogh's post-impressionist style is well documented.",
+        'category': 'art'
+    }
+    
+    def setUp(self):
+        _validate_from_key.cache_clear()
+        self.service = PuzzleGenerationService()
+        self.generator = mock.Mock()
+        self.generator.validate_puzzle = mock.AsyncMock(return_value={'is_valid': True, 'confidence': 0.9})
+    
+    async def test_revalidation_reuses_art_validation(self):
+        with mock.patch.object(
+            ArtPuzzleValidator, 'validate_art_puzzle', autospec=True,
+            side_effect=ArtPuzzleValidator.validate_art_puzzle
+        ) as validate_art_puzzle:
+            first = await self.service._validate_art_puzzle_quality(self.puzzle_data, 0.5, self.generator)
+            second = await self.service._validate_art_puzzle_quality(dict(self.puzzle_data), 0.5, self.generator)
+        
+        validate_art_puzzle.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertIsNot(first['quality_metrics'], second['quality_metrics'])
+        self.assertIsNot(first['difficulty_assessment'], second['difficulty_assessment'])
+
+
+@override_settings(PUZZLE_GENERATION_CACHE_TIMEOUT=60)
+class GenerationCacheTests(SimpleTestCase):
+    """Generated puzzles reused through the generation cache"""
+    
+    def setUp(self):
+        cache.clear()
+        self.generator = Claude4PuzzleGenerator()
+        self.generator.mock_mode = False
+        self.api_call = mock.AsyncMock(return_value=(
+            '{"question": "Who painted Water Lilies?", "solution": "Monet", "explanation": "Claude Monet."}'
+        ))
+        self.generator._call_claude_api = self.api_call
+    
+    async def test_unserialisable_constraints_skip_cache(self):
+        constraints = {'visual_puzzle': False, 'themes': {'impressionism'}}
+        puzzle_data = await self.generator.generate_puzzle('art', 0.5, constraints)
+        
+        self.assertEqual(puzzle_data['solution'], "Monet")
+        self.api_call.assert_awaited_once()
+
+
+class SyncWrapperTests(SimpleTestCase):
+    """Synchronous wrappers around the Claude generator"""
+    
+    async def test_refuses_running_event_loop(self):
+        with self.assertRaises(RuntimeError):
+            validate_claude_puzzle("What is 6 + 7?", "13", "math")
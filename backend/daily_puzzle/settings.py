@@ -133,11 +133,19 @@ CELERY_TIMEZONE = 'UTC'
 ANTHROPIC_API_KEY = config('ANTHROPIC_API_KEY', default='')
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
 GOOGLE_API_KEY = config('GOOGLE_API_KEY', default='')
+CLAUDE_FAST_MODEL = config('CLAUDE_FAST_MODEL', default='claude-3-5-haiku-20241022')
+ANTHROPIC_MAX_REQUESTS_PER_SECOND = config('ANTHROPIC_MAX_REQUESTS_PER_SECOND', default=50, cast=float)
 
 # Puzzle Configuration
 PUZZLE_CATEGORIES = ['math', 'word', 'art']
 AI_MODELS = ['gpt5', 'claude4', 'gemini']
 DIFFICULTY_ADJUSTMENT_STEP = 0.05
+# Seconds to reuse an API-generated puzzle for identical requests (0 disables)
+PUZZLE_GENERATION_CACHE_TIMEOUT = config('PUZZLE_GENERATION_CACHE_TIMEOUT', default=0, cast=int)
+# Seconds to reuse a generated daily puzzle for the same date, category and difficulty (0 disables)
+DAILY_PUZZLE_CACHE_TIMEOUT = config('DAILY_PUZZLE_CACHE_TIMEOUT', default=0, cast=int)
+# Seconds to reuse an AI validation of an unchanged puzzle (0 disables)
+PUZZLE_VALIDATION_CACHE_TIMEOUT = config('PUZZLE_VALIDATION_CACHE_TIMEOUT', default=4 * 60 * 60, cast=int)
 DIFFICULTY_MIN = 0.00
 DIFFICULTY_MAX = 1.00
 
@@ -8,6 +8,7 @@ from datetime import date
 
 from .models import Puzzle, PlayerProgress, StumpTally, DifficultyHistory
 from ai_services.manager import puzzle_service
+from ai_services.claude import Claude4PuzzleGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,7 @@ def generate_daily_puzzle():
         logger.error(f"Failed to generate daily puzzle: {str(e)}")
         return f"Failed to generate puzzle: {str(e)}"
     finally:
+        loop.run_until_complete(Claude4PuzzleGenerator.aclose())
         loop.close()
 
 
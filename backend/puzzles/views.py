@@ -16,6 +16,7 @@ from .serializers import (
     PuzzleGenerationRequestSerializer
 )
 from ai_services.manager import puzzle_service
+from ai_services.claude import Claude4PuzzleGenerator
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -326,6 +327,7 @@ def generate_puzzle_manually(request):
             return Response(response_data)
             
         finally:
+            loop.run_until_complete(Claude4PuzzleGenerator.aclose())
             loop.close()
             
     except Exception as e:
@@ -379,6 +381,7 @@ def generate_visual_art_puzzle(request):
             })
             
         finally:
+            loop.run_until_complete(Claude4PuzzleGenerator.aclose())
             loop.close()
             
     except Exception as e:
@@ -66,7 +66,7 @@ async def test_single_art_puzzle(difficulty: float = 0.5):
             print(f"\n⚠️ Issues Found ({len(validation.issues)}):")
             for issue in validation.issues:
                 severity_icon = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "critical": "🚨"}
-                icon = severity_icon.get(issue.severity.value, "❓")
+                icon = severity_icon.get(issue.severity.name.lower(), "❓")
                 print(f"  {icon} {issue.message}")
         
         # Print quality metrics